@@ -1,7 +1,7 @@
 from fastapi import APIRouter, HTTPException, Query
 from typing import List, Optional
 from app.models.models import Article, Claim, ScientificStudy, SearchResponse, StatusResponse, ArticleCreate, ArticleResponse
-from app.services.services import article_service
+from app.services import article_service
 import logging
 from app.core.database import database
 from datetime import datetime, timezone
@@ -68,6 +68,21 @@ async def create_article(article: ArticleCreate):
         logger.error(f"Error creating article: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/bulk", response_model=StatusResponse)
+async def create_articles_bulk(articles: List[Article]):
+    """Create several articles in a single database round trip."""
+    try:
+        article_ids = await article_service.create_many(articles)
+
+        return StatusResponse(
+            status="success",
+            message="Articles created successfully",
+            details={"ids": article_ids, "count": len(article_ids)}
+        )
+    except Exception as e:
+        logger.error(f"Error bulk creating articles: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/{article_id}", response_model=Article)
 async def get_article(article_id: str):
     """Retrieve an article by ID."""
@@ -86,6 +101,13 @@ async def get_article(article_id: str):
 async def update_article(article_id: str, article: Article):
     """Update an existing article."""
     try:
+        missing = await article_service.find_missing_studies(article.related_scientific_studies)
+        if missing:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Scientific studies not found: {', '.join(missing)}"
+            )
+        
         success = await article_service.update(article_id, article)
         if not success:
             raise HTTPException(status_code=404, detail="Article not found")
@@ -193,6 +215,9 @@ async def get_status():
 async def link_scientific_study(article_id: str, study_id: str):
     """Link a scientific study to an article."""
     try:
+        if await article_service.find_missing_studies([study_id]):
+            raise HTTPException(status_code=404, detail="Scientific study not found")
+        
         success = await article_service.link_scientific_study(article_id, study_id)
         if not success:
             raise HTTPException(status_code=404, detail="Article or scientific study not found")
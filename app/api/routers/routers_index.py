@@ -1,11 +0,0 @@
-from .scientific_study import router as scientific_study_router
-from .article import router as article_router
-from .search import router as search_router
-from .chat import router as chat_router
-
-__all__ = [
-    'scientific_study_router',
-    'article_router',
-    'search_router',
-    'chat_router'
-]
\ No newline at end of file
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional
 from app.models.models import ScientificStudy, SearchResponse, StatusResponse
 from app.services import scientific_study_service
@@ -15,14 +16,30 @@ async def create_scientific_study(study: ScientificStudy):
             study_id = await scientific_study_service.create_with_doi(study)
         else:
             study_id = await scientific_study_service.create(study)
-            
+        
+        # Only the id varies; skip building and re-validating a StatusResponse
+        return ORJSONResponse(content={
+            "status": "success",
+            "message": "Scientific study created successfully",
+            "details": {"id": study_id}
+        })
+    except Exception as e:
+        logger.error(f"Error creating scientific study: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/bulk", response_model=StatusResponse)
+async def create_scientific_studies_bulk(studies: List[ScientificStudy]):
+    """Create several scientific studies in a single database round trip."""
+    try:
+        study_ids = await scientific_study_service.create_many(studies)
+
         return StatusResponse(
             status="success",
-            message="Scientific study created successfully",
-            details={"id": study_id}
+            message="Scientific studies created successfully",
+            details={"ids": study_ids, "count": len(study_ids)}
         )
     except Exception as e:
-        logger.error(f"Error creating scientific study: {e}")
+        logger.error(f"Error bulk creating scientific studies: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/{study_id}", response_model=ScientificStudy)
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from typing import List, Dict, Any, Optional
 from app.models.models import SearchQuery, SearchResponse
-from app.services.services import search_service
+from app.services import search_service
 import logging
 from datetime import datetime
 
@@ -13,7 +14,12 @@ async def search_all_content(query: SearchQuery):
     """Search across all content types."""
     try:
         results = await search_service.search_all(query)
-        return results
+        # The results are already SearchResponse models; returning a
+        # response skips FastAPI validating them again against response_model
+        return ORJSONResponse(
+            content=[result.model_dump(mode="json") for result in results],
+            headers={"Cache-Control": "private, max-age=60"}
+        )
     except Exception as e:
         logger.error(f"Error searching content: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,198 @@
+# app/core/ann_index.py
+
+import logging
+import uuid
+from pathlib import Path
+from typing import List, Tuple, Any
+import numpy as np
+from bson import ObjectId
+from app.core.config import get_settings
+from app.core.database import Collection
+from app.core.embedding_matrix import OBJECT_ID_BYTES
+from app.core.vector_codec import decode_vector
+
+try:
+    import faiss
+except ImportError:  # faiss-cpu is optional; searches stay exact without it
+    faiss = None
+
+logger = logging.getLogger(__name__)
+
+# Graph neighbours per node; higher means better recall and a larger index
+HNSW_CONNECTIVITY = 32
+
+# Candidate list sizes while inserting and while searching
+HNSW_EF_CONSTRUCTION = 64
+HNSW_EF_SEARCH = 128
+
+class ANNIndex:
+    """HNSW approximate nearest neighbour index over one collection.
+
+    Vectors are unit length, so inner product equals cosine similarity.
+    Index rows are numbered in insertion order and mapped back to
+    ObjectIds through a parallel id array. The index is saved to the cache
+    directory on shutdown so restarts skip rebuilding the graph.
+
+    Every invalidation writes a new generation stamp next to the files.
+    An index only saves if it changed in this process and the stamp still
+    matches the one seen when it was loaded or built, so a graph another
+    process has since invalidated is never written back.
+    """
+
+    def __init__(self, collection: Collection):
+        """Initialize an empty index for a collection."""
+        self.settings = get_settings()
+        self.collection = collection
+        # Keyed by database too, like the embedding matrix
+        self.directory = self.settings.CACHE_DIR / "ann" / self.settings.ACTIVE_DATABASE_NAME
+        self._index = None
+        self._ids: List[ObjectId] = []
+        self._generation = ""
+        self._dirty = False
+
+    @staticmethod
+    def is_available() -> bool:
+        """Check whether faiss is installed."""
+        return faiss is not None
+
+    @property
+    def is_ready(self) -> bool:
+        """Check whether the index holds a graph to search."""
+        return self._index is not None
+
+    @property
+    def index_path(self) -> Path:
+        """Path of the serialized faiss index."""
+        return self.directory / f"{self.collection.value}.faiss"
+
+    @property
+    def ids_path(self) -> Path:
+        """Path of the ObjectId file."""
+        return self.directory / f"{self.collection.value}.ids"
+
+    @property
+    def generation_path(self) -> Path:
+        """Path of the generation stamp bumped by each invalidation."""
+        return self.directory / f"{self.collection.value}.generation"
+
+    def _read_generation(self) -> str:
+        """Return the current generation stamp, or "" if none was written."""
+        try:
+            return self.generation_path.read_text()
+        except FileNotFoundError:
+            return ""
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _new_index(self):
+        """Create an empty HNSW index."""
+        index = faiss.IndexHNSWFlat(
+            self.settings.VECTOR_DIMENSIONS,
+            HNSW_CONNECTIVITY,
+            faiss.METRIC_INNER_PRODUCT
+        )
+        index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+        index.hnsw.efSearch = HNSW_EF_SEARCH
+        return index
+
+    def build(self, ids: List[ObjectId], matrix: np.ndarray) -> None:
+        """Build the graph from scratch."""
+        self._generation = self._read_generation()
+        self._index = self._new_index()
+        self._ids = []
+        self._add(list(ids), matrix)
+        logger.info(f"Built HNSW index for {self.collection.value}: {len(self._ids)} vectors")
+
+    def append(self, items: List[Tuple[Any, Any]]) -> None:
+        """Insert (ObjectId, vector) rows into a built index."""
+        if not items or self._index is None:
+            return
+
+        ids, rows = [], []
+        for doc_id, vector in items:
+            vector = decode_vector(vector)
+            if vector.shape != (self.settings.VECTOR_DIMENSIONS,):
+                logger.warning(f"Skipping {doc_id}: unexpected vector shape {vector.shape}")
+                continue
+            ids.append(ObjectId(doc_id))
+            rows.append(vector)
+        if rows:
+            self._add(ids, np.stack(rows))
+
+    def _add(self, ids: List[ObjectId], rows: np.ndarray) -> None:
+        """Add rows to the graph and record their ids in the same order."""
+        if not ids:
+            return
+        self._index.add(np.ascontiguousarray(rows, dtype=np.float32))
+        self._ids.extend(ids)
+        self._dirty = True
+
+    def search(self, query_vector: np.ndarray, limit: int) -> List[Tuple[ObjectId, float]]:
+        """Return the ids and scores of the approximate closest vectors."""
+        if self._index is None or not self._ids:
+            return []
+
+        query = np.ascontiguousarray(query_vector, dtype=np.float32).reshape(1, -1)
+        scores, rows = self._index.search(query, min(limit, len(self._ids)))
+        return [
+            (self._ids[row], float(score))
+            for row, score in zip(rows[0], scores[0])
+            if row >= 0
+        ]
+
+    def save(self) -> None:
+        """Write the index and its ids to the cache directory if they changed."""
+        if self._index is None or not self._dirty:
+            return
+        if self._read_generation() != self._generation:
+            logger.info(f"HNSW index for {self.collection.value} was invalidated elsewhere; not saving it")
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            faiss.write_index(self._index, str(self.index_path))
+            with open(self.ids_path, "wb") as ids_file:
+                ids_file.write(b"".join(doc_id.binary for doc_id in self._ids))
+            self._dirty = False
+            logger.info(f"Saved HNSW index for {self.collection.value}: {len(self._ids)} vectors")
+        except Exception as e:
+            logger.error(f"Error saving HNSW index for {self.collection.value}: {e}")
+
+    def load(self) -> bool:
+        """Read a saved index from the cache directory.
+
+        Returns:
+            True if a usable index was loaded
+        """
+        if not self.is_available() or not (self.index_path.exists() and self.ids_path.exists()):
+            return False
+        try:
+            generation = self._read_generation()
+            index = faiss.read_index(str(self.index_path))
+            raw_ids = np.fromfile(self.ids_path, dtype=np.uint8).reshape(-1, OBJECT_ID_BYTES)
+            if index.ntotal != len(raw_ids):
+                logger.warning(f"Saved HNSW index for {self.collection.value} is inconsistent; ignoring it")
+                return False
+            index.hnsw.efSearch = HNSW_EF_SEARCH
+            self._index = index
+            self._ids = [ObjectId(row.tobytes()) for row in raw_ids]
+            self._generation = generation
+            self._dirty = False
+            logger.info(f"Loaded HNSW index for {self.collection.value}: {len(self._ids)} vectors")
+            return True
+        except Exception as e:
+            logger.error(f"Error loading HNSW index for {self.collection.value}: {e}")
+            return False
+
+    def invalidate(self) -> None:
+        """Drop the index in memory and on disk, bumping the generation."""
+        self._index = None
+        self._ids = []
+        self._dirty = False
+        for path in (self.index_path, self.ids_path):
+            path.unlink(missing_ok=True)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self.generation_path.write_text(uuid.uuid4().hex)
+        except OSError as e:
+            logger.error(f"Error writing HNSW generation for {self.collection.value}: {e}")
@@ -39,10 +39,29 @@ class Settings(BaseSettings):
         default="science_decoder",
         description="MongoDB database name"
     )
+    MONGODB_MAX_POOL_SIZE: int = Field(
+        default=50,
+        description="Maximum connections kept in the MongoDB client pool"
+    )
+    MONGODB_MIN_POOL_SIZE: int = Field(
+        default=10,
+        description="Connections the MongoDB client keeps open while idle"
+    )
+    MONGODB_MAX_IDLE_TIME_MS: int = Field(
+        default=60000,
+        description="Idle time after which a pooled MongoDB connection is closed"
+    )
     
     @property
     def TEST_DATABASE_NAME(self) -> str:
-        """Get test database name."""
+        """Get test database name.
+        
+        Each pytest-xdist worker gets its own database so parallel test
+        files never clean up each other's data.
+        """
+        worker = os.environ.get("PYTEST_XDIST_WORKER")
+        if worker:
+            return f"{self.DATABASE_NAME}_test_{worker}"
         return f"{self.DATABASE_NAME}_test"
     
     @property
@@ -70,8 +89,24 @@ class Settings(BaseSettings):
         description="SciBERT embedding dimensions"
     )
     VECTOR_SIMILARITY: Literal["cosine", "euclidean", "dot_product"] = Field(
-        default="cosine",
-        description="Vector similarity metric"
+        default="dot_product",
+        description="Vector similarity metric; stored vectors are unit length, so dot product equals cosine"
+    )
+    VECTOR_INDEX_NAME: str = Field(
+        default="vector_index",
+        description="Atlas Vector Search index name"
+    )
+    VECTOR_NUM_CANDIDATES_FACTOR: int = Field(
+        default=20,
+        description="Candidates considered per requested result in $vectorSearch"
+    )
+    VECTOR_QUANTIZATION: Literal["none", "scalar", "binary"] = Field(
+        default="scalar",
+        description="Atlas Vector Search index quantization (scalar keeps int8 vectors in the index)"
+    )
+    ANN_MIN_VECTORS: int = Field(
+        default=10_000,
+        description="Collection size at which client-side search switches to an HNSW index"
     )
     
     # Model settings
@@ -79,6 +114,18 @@ class Settings(BaseSettings):
         default="allenai/scibert_scivocab_uncased",
         description="Hugging Face model name"
     )
+    MODEL_DTYPE: Literal["auto", "float32", "bfloat16"] = Field(
+        default="auto",
+        description="Embedding model weight dtype; auto uses bfloat16 on GPUs that support it"
+    )
+    MODEL_COMPILE: bool = Field(
+        default=True,
+        description="Compile the embedding model with torch.compile when running on CUDA"
+    )
+    MODEL_QUANTIZE_CPU: bool = Field(
+        default=False,
+        description="Quantize the embedding model's linear layers to int8 when running on CPU"
+    )
     
     # Text processing settings
     CHUNK_SIZE: int = Field(
@@ -89,6 +136,10 @@ class Settings(BaseSettings):
         default=50, 
         description="Overlap between chunks"
     )
+    PDF_MAX_TEXT_CHARS: int = Field(
+        default=1_000_000,
+        description="Stop extracting PDF text past this many characters"
+    )
     
     # Application settings
     LOG_LEVEL: str = Field(
@@ -1,6 +1,9 @@
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase, AsyncIOMotorCollection
+from pymongo.errors import OperationFailure
+from pymongo.operations import SearchIndexModel
 from typing import Optional, Any, Dict
 import logging
+import time
 from .config import get_settings
 from enum import Enum
 
@@ -14,6 +17,19 @@ class Collection(str, Enum):
     MIGRATIONS = "migrations"  # Added migrations collection
     PDF_DOCUMENTS = "pdf_documents"  # Add this line for PDF documents
 
+# Collections whose documents carry an embedding searched with $vectorSearch
+VECTOR_COLLECTIONS = [Collection.SCIENTIFIC_STUDIES, Collection.ARTICLES]
+
+# Atlas spells the similarity metrics differently from our settings
+ATLAS_SIMILARITY = {
+    "cosine": "cosine",
+    "euclidean": "euclidean",
+    "dot_product": "dotProduct"
+}
+
+# Seconds before an index that was not queryable is checked again
+INDEX_STATUS_RECHECK_SECONDS = 30
+
 class DatabaseManager:
     """Manages database connections and operations."""
     
@@ -22,17 +38,23 @@ class DatabaseManager:
         self._client: Optional[AsyncIOMotorClient] = None
         self._db: Optional[AsyncIOMotorDatabase] = None
         self._collections: Dict[str, AsyncIOMotorCollection] = {}
+        # Collection -> (queryable, monotonic time it was checked)
+        self._vector_index_status: Dict[Collection, tuple] = {}
         self.settings = get_settings()
         logger.info("DatabaseManager initialized with settings")
     
     async def connect(self) -> None:
-        """Connect to MongoDB Atlas."""
+        """Connect to MongoDB Atlas; a no-op when already connected."""
         if self._client is None:
             try:
                 logger.info("Connecting to MongoDB Atlas...")
+                # One pooled client serves every request until disconnect()
                 self._client = AsyncIOMotorClient(
                     self.settings.MONGODB_ATLAS_URI,
-                    serverSelectionTimeoutMS=5000
+                    serverSelectionTimeoutMS=5000,
+                    maxPoolSize=self.settings.MONGODB_MAX_POOL_SIZE,
+                    minPoolSize=self.settings.MONGODB_MIN_POOL_SIZE,
+                    maxIdleTimeMS=self.settings.MONGODB_MAX_IDLE_TIME_MS
                 )
                 # Test the connection
                 await self._client.admin.command('ping')
@@ -75,6 +97,7 @@ class DatabaseManager:
             self._client = None
             self._db = None
             self._collections = {}
+            self._vector_index_status = {}
             logger.info("Disconnected from database")
     
     async def health_check(self) -> bool:
@@ -88,6 +111,83 @@ class DatabaseManager:
             logger.error(f"Database health check failed: {e}")
             return False
 
+    async def ensure_vector_indexes(self) -> None:
+        """Create the Atlas Vector Search index on each vector collection.
+        
+        Existing indexes are updated when their definition differs, e.g.
+        after changing VECTOR_QUANTIZATION. Deployments without Atlas Search
+        (e.g. a local mongod) only log a warning; searches then fall back to
+        scoring vectors client-side.
+        """
+        field = {
+            "type": "vector",
+            "path": "vector",
+            "numDimensions": self.settings.VECTOR_DIMENSIONS,
+            "similarity": ATLAS_SIMILARITY[self.settings.VECTOR_SIMILARITY]
+        }
+        # Atlas quantizes the indexed copy and keeps the full-fidelity
+        # vectors for rescoring, so this shrinks the in-memory graph only
+        if self.settings.VECTOR_QUANTIZATION != "none":
+            field["quantization"] = self.settings.VECTOR_QUANTIZATION
+        definition = {"fields": [field]}
+        
+        for collection in VECTOR_COLLECTIONS:
+            try:
+                coll = await self.get_collection(collection)
+                existing = await coll.list_search_indexes(self.settings.VECTOR_INDEX_NAME).to_list(length=1)
+                if existing:
+                    if existing[0].get("latestDefinition") != definition:
+                        await coll.update_search_index(self.settings.VECTOR_INDEX_NAME, definition)
+                        self._vector_index_status.pop(collection, None)
+                        logger.info(f"Updated vector search index on {collection.value}")
+                    continue
+                
+                await coll.create_search_index(
+                    SearchIndexModel(
+                        definition=definition,
+                        name=self.settings.VECTOR_INDEX_NAME,
+                        type="vectorSearch"
+                    )
+                )
+                self._vector_index_status.pop(collection, None)
+                logger.info(f"Created vector search index on {collection.value}")
+            except OperationFailure as e:
+                logger.warning(f"Could not create vector search index on {collection.value}: {e}")
+    
+    async def has_vector_index(self, collection: Collection) -> bool:
+        """Check whether a collection has an Atlas vector index, ready or building."""
+        try:
+            coll = await self.get_collection(collection)
+            indexes = await coll.list_search_indexes(self.settings.VECTOR_INDEX_NAME).to_list(length=1)
+            return bool(indexes)
+        except OperationFailure:
+            return False
+    
+    async def is_vector_index_queryable(self, collection: Collection) -> bool:
+        """Check whether $vectorSearch on a collection can return results.
+        
+        Atlas answers $vectorSearch against a missing or still-building index
+        with an empty cursor rather than an error, so callers check this
+        first. A queryable index is remembered; any other answer is checked
+        again after INDEX_STATUS_RECHECK_SECONDS.
+        """
+        status = self._vector_index_status.get(collection)
+        if status is not None:
+            queryable, checked_at = status
+            if queryable or time.monotonic() - checked_at < INDEX_STATUS_RECHECK_SECONDS:
+                return queryable
+        
+        try:
+            coll = await self.get_collection(collection)
+            indexes = await coll.list_search_indexes(self.settings.VECTOR_INDEX_NAME).to_list(length=1)
+            queryable = bool(indexes) and indexes[0].get("queryable") is True
+        except OperationFailure as e:
+            logger.debug(f"Search indexes unavailable on {collection.value}: {e}")
+            queryable = False
+        
+        self._vector_index_status[collection] = (queryable, time.monotonic())
+        return queryable
+    
     async def get_scientific_studies_collection(self) -> AsyncIOMotorCollection:
         """Convenience method to get scientific studies collection."""
         return await self.get_collection(Collection.SCIENTIFIC_STUDIES)
@@ -0,0 +1,203 @@
+# app/core/embedding_matrix.py
+
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List, Optional, Tuple, Any
+import numpy as np
+from bson import ObjectId
+from app.core.config import get_settings
+from app.core.database import database, Collection
+from app.core.vector_codec import decode_vector
+
+try:
+    import fcntl
+except ImportError:  # not on Windows; appends there are only serialized per process
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# ObjectIds are stored as their raw 12 bytes, one per matrix row
+OBJECT_ID_BYTES = 12
+
+# Rows scored per block so only a slice of the float16 file is upcast at once
+SCORE_BLOCK_ROWS = 65536
+
+def top_k(scores: np.ndarray, limit: int) -> np.ndarray:
+    """Indices of the highest scores, best first, without a full sort."""
+    limit = min(limit, len(scores))
+    if limit <= 0:
+        return np.empty(0, dtype=np.intp)
+    top = np.argpartition(-scores, limit - 1)[:limit]
+    return top[np.argsort(-scores[top])]
+
+class EmbeddingMatrix:
+    """Memory-mapped float16 copy of the embeddings of one collection.
+
+    The matrix lives in the cache directory, under the active database's
+    name, as two append-only files:
+    - <collection>.f16: row-major float16 embeddings
+    - <collection>.ids: the matching ObjectIds, 12 bytes per row
+
+    Searching it is a single matrix-vector product instead of a round trip
+    that ships every vector out of MongoDB. Appends and removals from
+    every worker sharing the files go through <collection>.lock.
+    """
+
+    def __init__(self, collection: Collection):
+        """Initialize the matrix for a collection."""
+        self.settings = get_settings()
+        self.collection = collection
+        self.dimensions = self.settings.VECTOR_DIMENSIONS
+        # Keyed by database too, so dev, test and each xdist worker keep
+        # separate files
+        self.directory = self.settings.CACHE_DIR / "embeddings" / self.settings.ACTIVE_DATABASE_NAME
+        self._matrix: Optional[np.memmap] = None
+        self._ids: Optional[np.ndarray] = None
+
+    @property
+    def matrix_path(self) -> Path:
+        """Path of the float16 embedding file."""
+        return self.directory / f"{self.collection.value}.f16"
+
+    @property
+    def ids_path(self) -> Path:
+        """Path of the ObjectId file."""
+        return self.directory / f"{self.collection.value}.ids"
+
+    @property
+    def lock_path(self) -> Path:
+        """Path of the file locked around appends and removals."""
+        return self.directory / f"{self.collection.value}.lock"
+
+    @contextmanager
+    def _file_lock(self):
+        """Hold the exclusive lock shared by every process using these files."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield
+
+    def exists(self) -> bool:
+        """Check whether a matrix has been built for this collection."""
+        return self.matrix_path.exists() and self.ids_path.exists()
+
+    def load(self) -> bool:
+        """Memory-map the matrix from disk.
+
+        Returns:
+            True if a usable matrix is loaded
+        """
+        if self._matrix is not None:
+            return True
+        if not self.exists():
+            return False
+
+        try:
+            ids = np.fromfile(self.ids_path, dtype=np.uint8).reshape(-1, OBJECT_ID_BYTES)
+            if len(ids) == 0:
+                return False
+
+            self._matrix = np.memmap(
+                self.matrix_path,
+                dtype=np.float16,
+                mode="r",
+                shape=(len(ids), self.dimensions)
+            )
+            self._ids = ids
+            logger.info(f"Loaded embedding matrix for {self.collection.value}: {len(ids)} rows")
+            return True
+        except Exception as e:
+            logger.error(f"Error loading embedding matrix for {self.collection.value}: {e}")
+            self._matrix = None
+            self._ids = None
+            return False
+
+    async def rebuild(self, batch_size: int = 1000) -> int:
+        """Dump every stored embedding of the collection to disk.
+
+        Returns:
+            Number of rows written
+        """
+        self.invalidate()
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        coll = await database.get_collection(self.collection)
+        cursor = coll.find(
+            {"vector": {"$exists": True, "$ne": None}},
+            projection={"vector": 1}
+        ).batch_size(batch_size)
+
+        rows = 0
+        with open(self.matrix_path, "wb") as matrix_file, open(self.ids_path, "wb") as ids_file:
+            while batch := await cursor.to_list(length=batch_size):
+                for doc in batch:
+                    vector = decode_vector(doc["vector"])
+                    if vector.shape != (self.dimensions,):
+                        logger.warning(f"Skipping {doc['_id']}: unexpected vector shape {vector.shape}")
+                        continue
+                    matrix_file.write(vector.astype(np.float16).tobytes())
+                    ids_file.write(doc["_id"].binary)
+                    rows += 1
+
+        logger.info(f"Built embedding matrix for {self.collection.value}: {rows} rows")
+        return rows
+
+    def append(self, items: List[Tuple[Any, Any]]) -> None:
+        """Append (ObjectId, vector) rows to an existing matrix.
+
+        Blocks on file I/O and the lock, so call it through asyncio.to_thread.
+        """
+        if not items or not self.exists():
+            return
+
+        matrix_rows, id_rows = [], []
+        for doc_id, vector in items:
+            vector = decode_vector(vector)
+            if vector.shape != (self.dimensions,):
+                logger.warning(f"Skipping {doc_id}: unexpected vector shape {vector.shape}")
+                continue
+            matrix_rows.append(vector.astype(np.float16).tobytes())
+            id_rows.append(ObjectId(doc_id).binary)
+        if not id_rows:
+            return
+
+        try:
+            with self._file_lock():
+                # Another worker may have removed the files while we waited
+                if not self.exists():
+                    return
+                # Rows before ids, so a reader never maps more ids than rows
+                with open(self.matrix_path, "ab") as matrix_file:
+                    matrix_file.write(b"".join(matrix_rows))
+                with open(self.ids_path, "ab") as ids_file:
+                    ids_file.write(b"".join(id_rows))
+
+            # Remap on next use so the new rows become visible
+            self._matrix = None
+            self._ids = None
+        except Exception as e:
+            logger.error(f"Error appending to embedding matrix for {self.collection.value}: {e}")
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        """Remove the matrix so searches fall back to MongoDB until rebuilt."""
+        self._matrix = None
+        self._ids = None
+        with self._file_lock():
+            for path in (self.matrix_path, self.ids_path):
+                path.unlink(missing_ok=True)
+
+    def search(self, query_vector: Any, limit: int) -> List[Tuple[ObjectId, float]]:
+        """Return the ids and scores of the rows closest to a query vector."""
+        if not self.load():
+            return []
+
+        query = np.asarray(query_vector, dtype=np.float32)
+        scores = np.empty(len(self._ids), dtype=np.float32)
+        for start in range(0, len(self._ids), SCORE_BLOCK_ROWS):
+            block = self._matrix[start:start + SCORE_BLOCK_ROWS]
+            scores[start:start + len(block)] = block.astype(np.float32) @ query
+
+        return [(ObjectId(self._ids[i].tobytes()), float(scores[i])) for i in top_k(scores, limit)]
@@ -0,0 +1,35 @@
+import aiohttp
+from typing import Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+class HTTPClientManager:
+    """Manages the shared aiohttp session used for outbound requests.
+
+    Reusing one session keeps its connection pool, so repeated requests to
+    the same host skip the DNS lookup and TCP/TLS handshake.
+    """
+
+    def __init__(self):
+        """Initialize HTTP client manager."""
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Get the shared session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+            logger.info("Created shared HTTP session")
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            logger.info("Closed shared HTTP session")
+
+# Create a singleton instance
+http_client = HTTPClientManager()
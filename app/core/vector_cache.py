@@ -0,0 +1,134 @@
+# app/core/vector_cache.py
+
+import asyncio
+import logging
+import time
+from typing import List, Optional, Tuple, Any
+import numpy as np
+from bson import ObjectId
+from app.core.config import get_settings
+from app.core.database import database, Collection
+from app.core.embedding_matrix import top_k
+from app.core.vector_codec import decode_vector
+
+logger = logging.getLogger(__name__)
+
+# Spare rows reserved as a fraction of the current size when the matrix grows
+GROWTH_FACTOR = 0.5
+
+# Seconds a loaded cache is trusted before it is rebuilt even if its count matches
+CACHE_TTL_SECONDS = 300
+
+class VectorCache:
+    """In-process float32 copy of the embeddings of one collection.
+
+    Built from MongoDB the first time a client-side search needs it and
+    kept current on inserts, so later searches are a single matrix-vector
+    product with no round trip for the vectors. The matrix keeps spare
+    rows so inserts fill it in place instead of copying it each time;
+    only the first len(ids) rows are live.
+
+    Inserts and deletes made by other workers never reach the matrix, so
+    before each use the collection's document count is compared with the
+    count seen at load plus this process's inserts. The cache is rebuilt
+    from MongoDB on a mismatch or once it is CACHE_TTL_SECONDS old.
+    """
+
+    def __init__(self, collection: Collection):
+        """Initialize an empty cache for a collection."""
+        self.collection = collection
+        self.dimensions = get_settings().VECTOR_DIMENSIONS
+        self._matrix: Optional[np.ndarray] = None
+        self._ids: List[ObjectId] = []
+        self._lock = asyncio.Lock()
+        self._document_count = 0
+        self._loaded_at = 0.0
+
+    @property
+    def is_loaded(self) -> bool:
+        """Check whether the cache holds a usable matrix."""
+        return self._matrix is not None
+
+    async def load(self, batch_size: int = 1000) -> bool:
+        """Build the matrix from MongoDB unless a current copy is loaded.
+
+        Returns:
+            True if the cache holds at least one vector
+        """
+        async with self._lock:
+            coll = await database.get_collection(self.collection)
+            # Metadata-only count; cheap enough to check before every search
+            document_count = await coll.estimated_document_count()
+            if self._matrix is not None:
+                age = time.monotonic() - self._loaded_at
+                if document_count == self._document_count and age < CACHE_TTL_SECONDS:
+                    return len(self._ids) > 0
+                logger.info(f"Vector cache for {self.collection.value} is stale; rebuilding")
+
+            cursor = coll.find(
+                {"vector": {"$exists": True, "$ne": None}},
+                projection={"vector": 1}
+            ).batch_size(batch_size)
+
+            ids, rows = [], []
+            async for doc in cursor:
+                vector = decode_vector(doc["vector"])
+                if vector.shape != (self.dimensions,):
+                    logger.warning(f"Skipping {doc['_id']}: unexpected vector shape {vector.shape}")
+                    continue
+                ids.append(doc["_id"])
+                rows.append(vector)
+
+            self._matrix = np.stack(rows) if rows else np.empty((0, self.dimensions), dtype=np.float32)
+            self._ids = ids
+            self._document_count = document_count
+            self._loaded_at = time.monotonic()
+            logger.info(f"Cached {len(ids)} vectors for {self.collection.value}")
+            return len(ids) > 0
+
+    def append(self, items: List[Tuple[Any, Any]]) -> None:
+        """Add (ObjectId, vector) rows to a loaded cache."""
+        if not items or self._matrix is None:
+            return
+
+        # Every item is a new document, even one whose vector is skipped
+        self._document_count += len(items)
+        ids, rows = [], []
+        for doc_id, vector in items:
+            vector = decode_vector(vector)
+            if vector.shape != (self.dimensions,):
+                logger.warning(f"Skipping {doc_id}: unexpected vector shape {vector.shape}")
+                continue
+            ids.append(ObjectId(doc_id))
+            rows.append(vector)
+        if not rows:
+            return
+
+        size = len(self._ids)
+        needed = size + len(rows)
+        if needed > len(self._matrix):
+            grown = np.empty((needed + int(needed * GROWTH_FACTOR), self.dimensions), dtype=np.float32)
+            grown[:size] = self._matrix[:size]
+            self._matrix = grown
+        self._matrix[size:needed] = np.stack(rows)
+        self._ids.extend(ids)
+
+    def rows(self) -> Tuple[List[ObjectId], Optional[np.ndarray]]:
+        """Return the cached ids and their live matrix rows."""
+        if self._matrix is None:
+            return self._ids, None
+        return self._ids, self._matrix[:len(self._ids)]
+
+    def invalidate(self) -> None:
+        """Drop the cache so the next search rebuilds it."""
+        self._matrix = None
+        self._ids = []
+
+    def search(self, query_vector: Any, limit: int) -> List[Tuple[ObjectId, float]]:
+        """Return the ids and scores of the rows closest to a query vector."""
+        if self._matrix is None or not self._ids:
+            return []
+
+        # One BLAS matrix-vector product over the contiguous live rows
+        scores = self._matrix[:len(self._ids)] @ np.asarray(query_vector, dtype=np.float32)
+        return [(self._ids[i], float(scores[i])) for i in top_k(scores, limit)]
@@ -1,9 +1,14 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 import logging
+import orjson
 from app.models.models import StatusResponse
 from app.core.database import database
 from app.core.config import get_settings
+from app.core.http_client import http_client
+from app.services.vector_service import vector_service
+from app.services import scientific_study_service, article_service
 from app.api.routers import (
     scientific_study_router,
     article_router,
@@ -16,6 +21,18 @@ from app.api.routers import (
 logging.basicConfig(level=get_settings().LOG_LEVEL)
 logger = logging.getLogger(__name__)
 
+# The healthy root response never changes, so it is serialized once
+_ROOT_BODY = orjson.dumps(
+    StatusResponse(
+        status="ok",
+        message="Welcome to the Science Decoder API!",
+        details={
+            "version": "2.0.0",
+            "database_status": "healthy"
+        }
+    ).model_dump()
+)
+
 # Application lifecycle management
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -24,10 +41,18 @@ async def lifespan(app: FastAPI):
         # Startup
         logger.info("Starting application...")
         await database.connect()
+        await database.ensure_vector_indexes()
+        await vector_service.start()
+        for service in (scientific_study_service, article_service):
+            await service.load_ann_index()
         yield
     finally:
         # Shutdown
         logger.info("Shutting down application...")
+        await vector_service.shutdown()
+        for service in (scientific_study_service, article_service):
+            service.ann_index.save()
+        await http_client.close()
         await database.disconnect()
 
 # Create FastAPI application
@@ -35,7 +60,8 @@ app = FastAPI(
     title="Science Decoder",
     description="Scientific content analysis and verification API",
     version="2.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Include routers
@@ -58,14 +84,7 @@ async def read_root():
                 detail="Database health check failed"
             )
         
-        return StatusResponse(
-            status="ok",
-            message="Welcome to the Science Decoder API!",
-            details={
-                "version": "2.0.0",
-                "database_status": "healthy"
-            }
-        )
+        return Response(content=_ROOT_BODY, media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
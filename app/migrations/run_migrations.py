@@ -7,7 +7,14 @@ from typing import List, Type
 from datetime import datetime
 from multiprocessing import freeze_support
 from .base import BaseMigration
-from .vector_migrations import UpdateArticleVectors, UpdateStudyVectors
+from .vector_migrations import (
+    UpdateArticleVectors,
+    UpdateStudyVectors,
+    PackArticleVectors,
+    PackStudyVectors,
+    NormalizeArticleVectors,
+    NormalizeStudyVectors
+)
 from app.core.database import database
 
 logger = logging.getLogger(__name__)
@@ -15,7 +22,11 @@ logger = logging.getLogger(__name__)
 # List of available migrations
 MIGRATIONS: List[Type[BaseMigration]] = [
     UpdateArticleVectors,
-    UpdateStudyVectors
+    UpdateStudyVectors,
+    PackArticleVectors,
+    PackStudyVectors,
+    NormalizeArticleVectors,
+    NormalizeStudyVectors
 ]
 
 async def setup_migrations_collection():
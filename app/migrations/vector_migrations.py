@@ -6,10 +6,23 @@ from datetime import datetime
 from .base import BaseMigration
 from app.core.database import Collection
 from app.services.vector_service import vector_service
+from app.core.vector_codec import encode_vector, decode_vector
+from app.core.embedding_matrix import EmbeddingMatrix
+from app.core.ann_index import ANNIndex
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
-class UpdateArticleVectors(BaseMigration):
+class VectorMigration(BaseMigration):
+    """Base for migrations that rewrite stored vectors."""
+    
+    async def run(self, batch_size: int = 100) -> None:
+        """Run the migration, then drop the now-stale matrix and HNSW index."""
+        await super().run(batch_size)
+        EmbeddingMatrix(self.collection_name).invalidate()
+        ANNIndex(self.collection_name).invalidate()
+
+class UpdateArticleVectors(VectorMigration):
     """Migration to update article vectors using new Vector Service."""
     
     def __init__(self):
@@ -34,12 +47,12 @@ class UpdateArticleVectors(BaseMigration):
                 return None
                 
             new_vector = await vector_service.generate_embedding(text)
-            if not new_vector:
+            if new_vector is None:
                 logger.error(f"Failed to generate vector for article {document.get('_id')}")
                 return None
             
             # Update document with new vector
-            document['vector'] = new_vector
+            document['vector'] = encode_vector(new_vector)
             document['updated_at'] = datetime.utcnow()
             
             return document
@@ -48,7 +61,7 @@ class UpdateArticleVectors(BaseMigration):
             logger.error(f"Error processing article {document.get('_id')}: {e}")
             return None
 
-class UpdateStudyVectors(BaseMigration):
+class UpdateStudyVectors(VectorMigration):
     """Migration to update scientific study vectors using new Vector Service."""
     
     def __init__(self):
@@ -79,16 +92,85 @@ class UpdateStudyVectors(BaseMigration):
             
             # Generate new vector
             new_vector = await vector_service.generate_embedding(text)
-            if not new_vector:
+            if new_vector is None:
                 logger.error(f"Failed to generate vector for study {document.get('_id')}")
                 return None
             
             # Update document with new vector
-            document['vector'] = new_vector
+            document['vector'] = encode_vector(new_vector)
             document['updated_at'] = datetime.utcnow()
             
             return document
             
         except Exception as e:
             logger.error(f"Error processing study {document.get('_id')}: {e}")
-            return None
\ No newline at end of file
+            return None
+
+class PackVectors(BaseMigration):
+    """Migration to repack array-of-doubles vectors as BSON binary float32.
+    
+    Documents written before vectors were packed still read correctly, but
+    take twice the space and decode element by element.
+    """
+    
+    async def should_process_document(self, document: Dict[str, Any]) -> bool:
+        """Check if the stored vector is still a plain array."""
+        return isinstance(document.get('vector'), list) and len(document['vector']) > 0
+    
+    async def process_document(self, document: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Pack the document's vector, leaving other fields untouched."""
+        return {
+            '_id': document['_id'],
+            'vector': encode_vector(document['vector'])
+        }
+
+class PackArticleVectors(PackVectors):
+    """Pack legacy article vectors."""
+    
+    def __init__(self):
+        super().__init__(Collection.ARTICLES)
+
+class PackStudyVectors(PackVectors):
+    """Pack legacy scientific study vectors."""
+    
+    def __init__(self):
+        super().__init__(Collection.SCIENTIFIC_STUDIES)
+
+class NormalizeVectors(VectorMigration):
+    """Migration to rescale stored vectors to unit length.
+    
+    Embeddings averaged over several chunks used to be stored without
+    renormalizing, so their dot products understated cosine similarity.
+    """
+    
+    async def should_process_document(self, document: Dict[str, Any]) -> bool:
+        """Check if the stored vector is off unit length."""
+        vector = decode_vector(document.get('vector'))
+        if vector is None or len(vector) == 0:
+            return False
+        return abs(float(np.linalg.norm(vector)) - 1.0) > 1e-3
+    
+    async def process_document(self, document: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Rescale the document's vector, leaving other fields untouched."""
+        vector = decode_vector(document['vector'])
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            logger.warning(f"Zero vector in document {document.get('_id')}")
+            return None
+        
+        return {
+            '_id': document['_id'],
+            'vector': encode_vector(vector / norm)
+        }
+
+class NormalizeArticleVectors(NormalizeVectors):
+    """Normalize article vectors."""
+    
+    def __init__(self):
+        super().__init__(Collection.ARTICLES)
+
+class NormalizeStudyVectors(NormalizeVectors):
+    """Normalize scientific study vectors."""
+    
+    def __init__(self):
+        super().__init__(Collection.SCIENTIFIC_STUDIES)
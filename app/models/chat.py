@@ -3,7 +3,13 @@
 from pydantic import BaseModel, Field, validator
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-from .models import PyObjectId
+from .models import PyObjectId, ChatMessage
+from .responses.chat import (
+    FindingsResponse,
+    ClaimResponse,
+    ScientificStudyAnalysisResponse,
+    ArticleAnalysisResponse
+)
 
 class ScientificStudyAnalysisRequest(BaseModel):
     """Request model for analyzing a scientific study.
@@ -46,52 +52,6 @@ class ArticleAnalysisRequest(BaseModel):
             raise ValueError("Question should be a meaningful inquiry about the article")
         return v.strip()
 
-class ScientificStudyFindings(BaseModel):
-    """Model for representing study findings in the analysis."""
-    key_points: List[str]
-    methodology: Optional[str]
-    limitations: List[str]
-    citation: str
-
-class ScientificStudyAnalysisResponse(BaseModel):
-    """Response model for scientific study analysis.
-    
-    This model provides a structured way to return analysis results, including
-    metadata about the study and the analysis process.
-    """
-    status: str = "success"
-    content_type: str = "scientific_study"
-    title: str
-    findings: ScientificStudyFindings
-    relevant_section: Optional[str]
-    confidence_score: float = Field(ge=0.0, le=1.0)
-    analysis_timestamp: datetime = Field(default_factory=datetime.utcnow)
-    metadata: Dict[str, Any] = Field(default_factory=dict)
-
-class ArticleClaim(BaseModel):
-    """Model for representing verified claims from an article."""
-    text: str
-    verified: bool
-    confidence_score: float = Field(ge=0.0, le=1.0)
-    verification_notes: Optional[str]
-
-class ArticleAnalysisResponse(BaseModel):
-    """Response model for article analysis.
-    
-    This model structures the response to include both the article's claims
-    and their verification status.
-    """
-    status: str = "success"
-    content_type: str = "article"
-    title: str
-    source: str
-    publication_date: datetime
-    claims: List[ArticleClaim]
-    scientific_support: List[Dict[str, str]]
-    relevant_section: Optional[str]
-    analysis_timestamp: datetime = Field(default_factory=datetime.utcnow)
-    metadata: Dict[str, Any] = Field(default_factory=dict)
-
 class ChatHistoryRequest(BaseModel):
     """Request model for retrieving chat history.
     
@@ -1,27 +1,64 @@
 from pydantic import BaseModel, Field, ConfigDict, HttpUrl, validator
-from pydantic.functional_validators import BeforeValidator
+from pydantic.functional_validators import AfterValidator, BeforeValidator
+from pydantic.functional_serializers import PlainSerializer
+from pydantic.json_schema import WithJsonSchema
 from typing import List, Optional, Any, Dict, Annotated
 from bson import ObjectId
 from datetime import datetime, timezone
+from functools import lru_cache
+import numpy as np
 import logging
+from app.core.vector_codec import decode_vector
 
 # Set up logging to help us track what's happening
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Custom type for handling MongoDB ObjectId
-def validate_object_id(v: Any) -> str:
-    """Convert different types of input to a valid ObjectId string"""
-    if isinstance(v, ObjectId):
-        return str(v)
-    if isinstance(v, str):
-        try:
-            return str(ObjectId(v))
-        except Exception:
-            raise ValueError("Invalid ObjectId format")
-    raise ValueError("Invalid ObjectId")
+def _oid_to_str(v: Any) -> Any:
+    """Accept ObjectIds read from MongoDB by rendering them as strings"""
+    return str(v) if isinstance(v, ObjectId) else v
+
+def _is_hex24(s: str) -> bool:
+    """Check for 24 hex characters with one C-level bytes.fromhex pass"""
+    if len(s) != 24:
+        return False
+    try:
+        # fromhex skips whitespace, so also require all 12 bytes
+        return len(bytes.fromhex(s)) == 12
+    except ValueError:
+        return False
+
+def _check_oid(v: str) -> str:
+    """Reject strings that are not valid ObjectIds without building one"""
+    if not _is_hex24(v):
+        raise ValueError("Invalid ObjectId format")
+    # Canonical form, matching str(ObjectId(v))
+    return v.lower()
+
+# pydantic-core validates the str itself; the ObjectId check is a length test
+# plus one bytes.fromhex call, never an ObjectId construction
+PyObjectId = Annotated[str, BeforeValidator(_oid_to_str), AfterValidator(_check_oid)]
+
+def _to_vector(v: Any) -> Any:
+    """Decode a vector and require a flat array of numbers"""
+    try:
+        array = decode_vector(v)
+    except (TypeError, ValueError) as e:
+        # pydantic only reports ValueError as a validation error
+        raise ValueError(f"Invalid vector: {e}")
+    if array is not None and array.ndim != 1:
+        raise ValueError("Vector must be a flat list of numbers")
+    return array
 
-PyObjectId = Annotated[str, BeforeValidator(validate_object_id)]
+# Embeddings live in memory as float32 arrays and in MongoDB as packed binary;
+# they only become a list of floats when rendered as JSON
+Vector = Annotated[
+    np.ndarray,
+    BeforeValidator(_to_vector),
+    PlainSerializer(lambda v: v.tolist(), return_type=List[float], when_used="json"),
+    WithJsonSchema({"type": "array", "items": {"type": "number"}})
+]
 
 def ensure_utc_datetime(value: Any) -> datetime:
     """Convert various datetime inputs to UTC datetime objects"""
@@ -47,6 +84,14 @@ def ensure_utc_datetime(value: Any) -> datetime:
             raise ValueError("Invalid datetime format. Use ISO format (YYYY-MM-DDTHH:MM:SS+00:00)")
     raise ValueError("Value must be a datetime object or ISO format string")
 
+@lru_cache(maxsize=None)
+def _datetime_fields(model: type) -> tuple:
+    """Names of a model's datetime fields, computed once per class"""
+    return tuple(
+        name for name, field in model.model_fields.items()
+        if field.annotation in (datetime, Optional[datetime])
+    )
+
 class BaseDocument(BaseModel):
     """Base document with common fields"""
     model_config = ConfigDict(
@@ -58,11 +103,34 @@ class BaseDocument(BaseModel):
     title: str
     text: str
     topic: str
-    vector: Optional[List[float]] = None
+    vector: Optional[Vector] = None
     metadata: Dict[str, Any] = Field(default_factory=dict)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
+    @classmethod
+    def _from_mongo_values(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert BSON-specific values into the types the fields hold."""
+        if "_id" in values:
+            values["id"] = str(values.pop("_id"))
+        if values.get("vector") is not None:
+            values["vector"] = decode_vector(values["vector"])
+        # Older documents stored some dates as ISO strings
+        for name in _datetime_fields(cls):
+            value = values.get(name)
+            if isinstance(value, str):
+                values[name] = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return values
+
+    @classmethod
+    def from_mongo(cls, document: Dict[str, Any]):
+        """Build a model from a stored document without re-validating it.
+        
+        Documents are validated on their way into the database, so reads
+        only convert BSON types instead of walking every validator again.
+        """
+        return cls.model_construct(**cls._from_mongo_values(dict(document)))
+
 class ScientificStudy(BaseDocument):
     """Represents a scientific research paper or study"""
     model_config = ConfigDict(
@@ -128,6 +196,26 @@ class Article(BaseDocument):
     article_type: str = Field(default="news")  # news, blog, opinion, etc.
     credibility_score: Optional[float] = None
 
+    @classmethod
+    def _from_mongo_values(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert BSON values, including ids nested in claims."""
+        values = super()._from_mongo_values(values)
+        if "source_url" in values:
+            values["source_url"] = HttpUrl(values["source_url"])
+        values["related_scientific_studies"] = [
+            str(study_id) for study_id in values.get("related_scientific_studies", [])
+        ]
+        values["claims"] = [
+            Claim.model_construct(**{
+                **claim,
+                "related_scientific_study_ids": [
+                    str(study_id) for study_id in claim.get("related_scientific_study_ids", [])
+                ]
+            })
+            for claim in values.get("claims", [])
+        ]
+        return values
+
 class SearchQuery(BaseModel):
     """Search query parameters"""
     model_config = ConfigDict(populate_by_name=True)
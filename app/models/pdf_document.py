@@ -57,6 +57,15 @@ class PDFDocument(BaseDocument):
             }
         }
     
+    @classmethod
+    def _from_mongo_values(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert BSON values, including the relationship ids."""
+        values = super()._from_mongo_values(values)
+        for field in ("scientific_study_id", "article_id"):
+            if values.get(field) is not None:
+                values[field] = str(values[field])
+        return values
+    
     @validator('processing_status')
     def validate_status(cls, v):
         """Ensure processing status is valid."""
@@ -1,7 +1,7 @@
 # app/models/responses/chat.py
 
 from pydantic import BaseModel, Field, validator
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Literal
 from datetime import datetime
 import logging
 
@@ -67,9 +67,8 @@ class ScientificStudyAnalysisResponse(BaseResponse):
     This takes our findings and wraps them in a nice package with
     all the information someone might need to understand the study.
     """
-    content_type: str = Field(
+    content_type: Literal["scientific_study"] = Field(
         default="scientific_study",
-        const=True,
         description="The type of content we analyzed"
     )
     title: str = Field(
@@ -122,9 +121,8 @@ class ArticleAnalysisResponse(BaseResponse):
     This organizes our analysis of an article, including whether its
     claims are supported by scientific evidence.
     """
-    content_type: str = Field(
+    content_type: Literal["article"] = Field(
         default="article",
-        const=True,
         description="The type of content we analyzed"
     )
     title: str = Field(
@@ -169,9 +167,8 @@ class ErrorResponse(BaseModel):
     This helps users understand what went wrong and how
     they might fix it.
     """
-    status: str = Field(
+    status: Literal["error"] = Field(
         default="error",
-        const=True,
         description="Indicates this is an error response"
     )
     code: int = Field(
@@ -189,7 +186,7 @@ class ErrorResponse(BaseModel):
 
     class Config:
         """Extra settings for this model."""
-        schema_extra = {
+        json_schema_extra = {
             "example": {
                 "status": "error",
                 "code": 404,
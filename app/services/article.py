@@ -2,51 +2,78 @@ from typing import List, Optional, Dict, Any
 import logging
 from app.core.database import Collection, database  # Added database import
 from app.models import Article, Claim, SearchResponse, ScientificStudy
+from app.core.http_client import http_client
 from .base import BaseService
-import aiohttp
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from collections import OrderedDict
 from datetime import datetime
 from bson import ObjectId
 
 logger = logging.getLogger(__name__)
 
+# Metadata only lives in <title> and <meta>, so skip building the rest of the DOM
+METADATA_TAGS = SoupStrainer(["title", "meta"])
+
+# Number of parsed pages remembered for ETag revalidation
+METADATA_CACHE_SIZE = 256
+
 class ArticleService(BaseService[Article]):
     """Service for handling news article and blog post operations."""
     
     def __init__(self):
         """Initialize the article service."""
         super().__init__(Collection.ARTICLES, Article)
+        # url -> (ETag, metadata) for pages we have already parsed
+        self._metadata_cache: OrderedDict[str, tuple] = OrderedDict()
     
     async def fetch_article_metadata(self, url: str) -> Dict[str, Any]:
         """Fetch metadata for an article from its URL."""
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    "User-Agent": "Mozilla/5.0 (compatible; ScienceDecoderBot/1.0)"
-                }
-                
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        soup = BeautifulSoup(html, 'html.parser')
-                        
-                        # Find meta tags first to avoid repeated lookups
-                        meta_description = soup.find("meta", {"name": "description"})
-                        
-                        # Extract metadata
-                        metadata = {
-                            "title": soup.title.string if soup.title else None,
-                            "description": meta_description.get("content") if meta_description else None,
-                            "author": (meta_author.get("content") if (meta_author := soup.find("meta", {"name": "author"})) else None),
-                            "published_date": (meta_pub_date.get("content") if (meta_pub_date := soup.find("meta", {"property": "article:published_time"})) else None),
-                            "modified_date": (meta_mod_date.get("content") if (meta_mod_date := soup.find("meta", {"property": "article:modified_time"})) else None),
-                            "keywords": (meta_keywords.get("content") if (meta_keywords := soup.find("meta", {"name": "keywords"})) else None)
-                        }
-                        
-                        return {k: v for k, v in metadata.items() if v is not None}
-                    else:
-                        logger.warning(f"Failed to fetch article metadata: {response.status}")
-                        return {}
+            session = await http_client.get_session()
+            headers = {
+                "User-Agent": "Mozilla/5.0 (compatible; ScienceDecoderBot/1.0)"
+            }
+            
+            # Ask the server to skip the body if the page is unchanged
+            cached = self._metadata_cache.get(url)
+            if cached:
+                headers["If-None-Match"] = cached[0]
+            
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304 and cached:
+                    self._metadata_cache.move_to_end(url)
+                    return dict(cached[1])
+                elif response.status == 200:
+                    # Hand raw bytes to the parser to avoid a separate decode pass
+                    html = await response.read()
+                    soup = BeautifulSoup(html, 'html.parser', parse_only=METADATA_TAGS)
+                    
+                    # Find meta tags first to avoid repeated lookups
+                    meta_description = soup.find("meta", {"name": "description"})
+                    
+                    # Extract metadata
+                    metadata = {
+                        "title": soup.title.string if soup.title else None,
+                        "description": meta_description.get("content") if meta_description else None,
+                        "author": (meta_author.get("content") if (meta_author := soup.find("meta", {"name": "author"})) else None),
+                        "published_date": (meta_pub_date.get("content") if (meta_pub_date := soup.find("meta", {"property": "article:published_time"})) else None),
+                        "modified_date": (meta_mod_date.get("content") if (meta_mod_date := soup.find("meta", {"property": "article:modified_time"})) else None),
+                        "keywords": (meta_keywords.get("content") if (meta_keywords := soup.find("meta", {"name": "keywords"})) else None)
+                    }
+                    
+                    metadata = {k: v for k, v in metadata.items() if v is not None}
+                    
+                    etag = response.headers.get("ETag")
+                    if etag:
+                        self._metadata_cache[url] = (etag, metadata)
+                        self._metadata_cache.move_to_end(url)
+                        if len(self._metadata_cache) > METADATA_CACHE_SIZE:
+                            self._metadata_cache.popitem(last=False)
+                    
+                    return dict(metadata)
+                else:
+                    logger.warning(f"Failed to fetch article metadata: {response.status}")
+                    return {}
         except Exception as e:
             logger.error(f"Error fetching article metadata: {e}")
             return {}
@@ -123,6 +150,33 @@ class ArticleService(BaseService[Article]):
             logger.error(f"Error linking scientific study: {e}")
             raise
 
+    async def find_missing_studies(self, study_ids: List[str]) -> List[str]:
+        """Return the ids that match no scientific study.
+        
+        Every id is checked in one $in query on _id rather than one lookup
+        per citation.
+        """
+        try:
+            # str(ObjectId) is lowercase hex, so compare ids in that form
+            wanted = list(dict.fromkeys(str(study_id).lower() for study_id in study_ids))
+            valid = [ObjectId(study_id) for study_id in wanted if ObjectId.is_valid(study_id)]
+            if not valid:
+                return wanted
+            
+            scientific_studies_coll = await database.get_collection(
+                Collection.SCIENTIFIC_STUDIES
+            )
+            existing = await scientific_studies_coll.find(
+                {"_id": {"$in": valid}},
+                projection={"_id": 1}
+            ).to_list(length=len(valid))
+            
+            found = {str(doc["_id"]) for doc in existing}
+            return [study_id for study_id in wanted if study_id not in found]
+        except Exception as e:
+            logger.error(f"Error checking scientific studies exist: {e}")
+            raise
+
     async def get_related_scientific_studies(
         self,
         article_id: str
@@ -138,11 +192,13 @@ class ArticleService(BaseService[Article]):
                 Collection.SCIENTIFIC_STUDIES
             )
             
-            cursor = scientific_studies_coll.find({
-                "_id": {"$in": article["related_scientific_studies"]}
-            })
+            related_ids = article["related_scientific_studies"]
+            documents = await scientific_studies_coll.find(
+                {"_id": {"$in": related_ids}},
+                projection={"vector": 0}
+            ).to_list(length=len(related_ids))
             
-            return [ScientificStudy(**doc) async for doc in cursor]
+            return [ScientificStudy.from_mongo(doc) for doc in documents]
         except Exception as e:
             logger.error(f"Error getting related scientific studies: {e}")
             raise
@@ -159,7 +215,7 @@ class ArticleService(BaseService[Article]):
             
             return [
                 SearchResponse(
-                    content=Article(**{k: v for k, v in doc.items() if k != "similarity"}),
+                    content=Article.from_mongo(doc),
                     score=doc["similarity"],
                     content_type="article"
                 )
@@ -169,16 +225,5 @@ class ArticleService(BaseService[Article]):
             logger.error(f"Error searching similar articles: {e}")
             raise
 
-    # article.py
-    async def search_by_topic(self, topic: str, limit: int = 10) -> List[Article]:
-        """Search for articles by topic."""
-        try:
-            coll = await self.get_collection()
-            cursor = coll.find({"topic": topic}).limit(limit)
-            return [Article(**doc) async for doc in cursor]
-        except Exception as e:
-            logger.error(f"Error searching by topic: {e}")
-            raise
-
 # Create singleton instance
 article_service = ArticleService()
\ No newline at end of file
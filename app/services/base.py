@@ -1,10 +1,18 @@
 from typing import List, Optional, TypeVar, Generic, Any
 from datetime import datetime
+import asyncio
 import logging
 from app.core.database import database, Collection
 from app.models.models import BaseDocument
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo.errors import OperationFailure
+from pydantic import AnyUrl
+import numpy as np
+from app.core.vector_codec import encode_vector, normalize_vector
+from app.core.embedding_matrix import EmbeddingMatrix
+from app.core.ann_index import ANNIndex
+from app.core.vector_cache import VectorCache
 from .vector_service import vector_service  # Import our new VectorService
 
 logger = logging.getLogger(__name__)
@@ -19,13 +27,41 @@ class BaseService(Generic[T]):
         self.collection_name = collection
         self.model_class = model_class
         self.settings = database.settings
+        self.embedding_matrix = EmbeddingMatrix(collection)
+        self.vector_cache = VectorCache(collection)
+        self.ann_index = ANNIndex(collection)
     
     async def get_collection(self) -> AsyncIOMotorCollection:
         """Get the database collection for this service."""
         logger.info(f"Getting collection: {self.collection_name}")
         return await database.get_collection(self.collection_name)
 
-    async def generate_embedding(self, text: str) -> Optional[List[float]]:
+    def _to_document(self, item: T) -> dict:
+        """Convert a model to a MongoDB document with a packed unit-length vector."""
+        # Convert to dict and remove None values
+        document = item.model_dump(by_alias=True, exclude_none=True)
+        
+        # Remove id if it's None
+        if "_id" in document and document["_id"] is None:
+            del document["_id"]
+        
+        # BSON has no URL type, so store pydantic URLs as plain strings
+        for key, value in document.items():
+            if isinstance(value, AnyUrl):
+                document[key] = str(value)
+        
+        if "vector" in document:
+            # Reject before writing; the caches and the Atlas index assume one width
+            if len(document["vector"]) != self.settings.VECTOR_DIMENSIONS:
+                raise ValueError(
+                    f"Vector has {len(document['vector'])} dimensions, "
+                    f"expected {self.settings.VECTOR_DIMENSIONS}"
+                )
+            # Unit length lets every search score with a plain dot product
+            document["vector"] = encode_vector(normalize_vector(document["vector"]))
+        return document
+
+    async def generate_embedding(self, text: str) -> Optional[np.ndarray]:
         """Generate vector embedding for text using VectorService."""
         try:
             logger.info(f"Generating embedding for text of length: {len(text)}")
@@ -40,39 +76,99 @@ class BaseService(Generic[T]):
             logger.info(f"Creating new {self.collection_name} item")
             
             # Generate vector embedding if not provided
-            if not item.vector and hasattr(item, 'text'):
+            if item.vector is None and hasattr(item, 'text'):
                 item.vector = await self.generate_embedding(item.text)
-                if not item.vector:
+                if item.vector is None:
                     raise ValueError("Failed to generate vector embedding")
             
             # Set timestamps
             item.created_at = datetime.utcnow()
             item.updated_at = datetime.utcnow()
             
-            # Convert to dict and remove None values
-            document = item.model_dump(by_alias=True, exclude_none=True)
-            
-            # Remove id if it's None
-            if "_id" in document and document["_id"] is None:
-                del document["_id"]
+            document = self._to_document(item)
             
             # Get collection and insert document
             coll = await self.get_collection()
             result = await coll.insert_one(document)
             
+            if "vector" in document:
+                rows = [(result.inserted_id, document["vector"])]
+                await asyncio.to_thread(self.embedding_matrix.append, rows)
+                self.vector_cache.append(rows)
+                self.ann_index.append(rows)
+            
             logger.info(f"Created new {self.collection_name} with ID: {result.inserted_id}")
             return str(result.inserted_id)
         except Exception as e:
             logger.error(f"Error creating {self.collection_name}: {e}")
             raise
 
-    async def get_by_id(self, item_id: str) -> Optional[T]:
-        """Retrieve an item by its ID."""
+    async def create_many(self, items: List[T]) -> List[str]:
+        """Create several items with a single bulk insert."""
+        try:
+            logger.info(f"Creating {len(items)} new {self.collection_name} items")
+            
+            # Embed every item still missing a vector in shared forward passes
+            pending = [item for item in items if item.vector is None and hasattr(item, 'text')]
+            if pending:
+                vectors = await vector_service.generate_text_embeddings([item.text for item in pending])
+                for item, vector in zip(pending, vectors):
+                    if vector is None:
+                        raise ValueError("Failed to generate vector embedding")
+                    item.vector = vector
+            
+            documents = []
+            for item in items:
+                item.created_at = datetime.utcnow()
+                item.updated_at = datetime.utcnow()
+                documents.append(self._to_document(item))
+            
+            if not documents:
+                return []
+            
+            # One round trip for the whole batch instead of one per item
+            coll = await self.get_collection()
+            result = await coll.insert_many(documents, ordered=False)
+            
+            rows = [
+                (document["_id"], document["vector"])
+                for document in documents
+                if "vector" in document
+            ]
+            await asyncio.to_thread(self.embedding_matrix.append, rows)
+            self.vector_cache.append(rows)
+            self.ann_index.append(rows)
+            
+            logger.info(f"Created {len(result.inserted_ids)} {self.collection_name} items")
+            return [str(inserted_id) for inserted_id in result.inserted_ids]
+        except Exception as e:
+            logger.error(f"Error bulk creating {self.collection_name}: {e}")
+            raise
+
+    async def get_by_id(
+        self,
+        item_id: str,
+        include_vector: bool = False,
+        projection: Optional[dict] = None
+    ) -> Optional[T]:
+        """Retrieve an item by its ID.
+        
+        The stored embedding is left out unless include_vector is set, since
+        callers almost never read it and it is the largest field. Callers
+        that need only a few fields can pass a projection such as
+        {"text": 1}; the returned model then holds just those fields.
+        """
+        # A malformed id cannot match anything; report it as not found
+        if not ObjectId.is_valid(item_id):
+            return None
+        
         try:
             coll = await database.get_collection(self.collection_name)
-            document = await coll.find_one({"_id": ObjectId(item_id)})
+            if projection is None and not include_vector:
+                projection = {"vector": 0}
+            document = await coll.find_one({"_id": ObjectId(item_id)}, projection=projection)
             if document:
-                return self.model_class(**document)
+                return self.model_class.from_mongo(document)
             return None
         except Exception as e:
             logger.error(f"Error retrieving {self.collection_name}: {e}")
@@ -80,13 +176,16 @@ class BaseService(Generic[T]):
 
     async def update(self, item_id: str, item: T) -> bool:
         """Update an existing item."""
+        if not ObjectId.is_valid(item_id):
+            return False
+        
         try:
             # Update vector if text has changed
             if hasattr(item, 'text'):
                 item.vector = await self.generate_embedding(item.text)
             
             item.updated_at = datetime.utcnow()
-            update_data = item.model_dump(by_alias=True, exclude_none=True)
+            update_data = self._to_document(item)
             
             # Remove id from update data
             if "_id" in update_data:
@@ -101,6 +200,11 @@ class BaseService(Generic[T]):
             success = result.modified_count > 0
             if success:
                 logger.info(f"Updated {self.collection_name} with ID: {item_id}")
+                # The stored row for this item is stale now
+                if "vector" in update_data:
+                    self.embedding_matrix.invalidate()
+                    self.vector_cache.invalidate()
+                    self.ann_index.invalidate()
             return success
         except Exception as e:
             logger.error(f"Error updating {self.collection_name}: {e}")
@@ -108,6 +212,9 @@ class BaseService(Generic[T]):
 
     async def delete(self, item_id: str) -> bool:
         """Delete an item by its ID."""
+        if not ObjectId.is_valid(item_id):
+            return False
+        
         try:
             coll = await database.get_collection(self.collection_name)
             result = await coll.delete_one({"_id": ObjectId(item_id)})
@@ -120,6 +227,139 @@ class BaseService(Generic[T]):
             logger.error(f"Error deleting {self.collection_name}: {e}")
             raise
 
+    async def search_by_topic(self, topic: str, limit: int = 10) -> List[T]:
+        """Search for items by topic."""
+        try:
+            coll = await self.get_collection()
+            # Skip the embedding on the wire; topic listings never use it
+            documents = await coll.find(
+                {"topic": topic},
+                projection={"vector": 0}
+            ).to_list(length=limit)
+            return [self.model_class.from_mongo(doc) for doc in documents]
+        except Exception as e:
+            logger.error(f"Error searching {self.collection_name} by topic: {e}")
+            raise
+
+    def _vector_search_pipeline(
+        self,
+        query_vector: np.ndarray,
+        limit: int,
+        min_score: float
+    ) -> List[dict]:
+        """Build an Atlas $vectorSearch pipeline.
+        
+        Atlas reports cosine/dot product scores rescaled to (1 + score) / 2,
+        so we map them back to the raw similarity used everywhere else.
+        """
+        return [
+            {
+                "$vectorSearch": {
+                    "index": self.settings.VECTOR_INDEX_NAME,
+                    "path": "vector",
+                    "queryVector": encode_vector(query_vector),
+                    "numCandidates": limit * self.settings.VECTOR_NUM_CANDIDATES_FACTOR,
+                    "limit": limit
+                }
+            },
+            {
+                "$addFields": {
+                    "similarity": {
+                        "$max": [
+                            0.0,
+                            {"$subtract": [
+                                {"$multiply": [2, {"$meta": "vectorSearchScore"}]},
+                                1
+                            ]}
+                        ]
+                    }
+                }
+            },
+            {"$match": {"similarity": {"$gte": min_score}}},
+            {"$project": {"vector": 0}}
+        ]
+
+    async def load_ann_index(self) -> bool:
+        """Get the HNSW index ready for client-side searches.
+        
+        Nothing is loaded when the collection has an Atlas vector index,
+        since $vectorSearch then serves every query. Otherwise a copy saved
+        by the previous shutdown is preferred, and failing that the graph is
+        built from the vector cache once the collection is large enough for
+        an exact scan to be the bottleneck.
+        
+        Returns:
+            True if the index is ready
+        """
+        if not ANNIndex.is_available():
+            return False
+        if await database.has_vector_index(self.collection_name):
+            return False
+        if self.ann_index.is_ready or self.ann_index.load():
+            return True
+        
+        try:
+            if not await self.vector_cache.load():
+                return False
+            ids, matrix = self.vector_cache.rows()
+            if len(ids) < self.settings.ANN_MIN_VECTORS:
+                return False
+            # Graph construction is CPU-bound; keep it off the event loop
+            await asyncio.to_thread(self.ann_index.build, ids, matrix)
+            return True
+        except Exception as e:
+            logger.error(f"Error building HNSW index for {self.collection_name}: {e}")
+            return False
+
+    async def _scan_search(
+        self,
+        coll: AsyncIOMotorCollection,
+        query_vector: np.ndarray,
+        limit: int,
+        min_score: float
+    ) -> List[dict]:
+        """Score stored vectors client-side for clusters without Atlas Search.
+        
+        Walks the HNSW index when one is ready, then tries the precomputed
+        embedding matrix, and otherwise the in-process vector cache, which
+        is filled from MongoDB on first use. Either way the winning
+        documents are fetched last.
+        """
+        if self.ann_index.is_ready:
+            matches = self.ann_index.search(query_vector, limit)
+        elif self.embedding_matrix.load():
+            matches = self.embedding_matrix.search(query_vector, limit)
+        elif await self.vector_cache.load():
+            matches = self.vector_cache.search(query_vector, limit)
+        else:
+            return []
+        
+        similarities = {
+            doc_id: float(np.clip(score, 0.0, 1.0))
+            for doc_id, score in matches
+            if score >= min_score
+        }
+        return await self._fetch_scored(coll, similarities, limit)
+
+    async def _fetch_scored(
+        self,
+        coll: AsyncIOMotorCollection,
+        similarities: dict,
+        limit: int
+    ) -> List[dict]:
+        """Fetch documents by id and attach their similarity scores."""
+        if not similarities:
+            return []
+        
+        documents = await coll.find(
+            {"_id": {"$in": list(similarities)}},
+            projection={"vector": 0}
+        ).to_list(length=limit)
+        for doc in documents:
+            doc["similarity"] = similarities[doc["_id"]]
+        documents.sort(key=lambda doc: doc["similarity"], reverse=True)
+        return documents
+
     async def search_similar(
         self,
         query_text: str,
@@ -130,48 +370,30 @@ class BaseService(Generic[T]):
         try:
             # Generate query vector
             query_vector = await self.generate_embedding(query_text)
-            if not query_vector:
+            if query_vector is None:
                 raise ValueError("Failed to generate query vector")
             
             coll = await database.get_collection(self.collection_name)
             
-            # Use vector_service to calculate similarities
-            pipeline = [
-                {
-                    "$addFields": {
-                        "similarity": {
-                            "$let": {
-                                "vars": {
-                                    "dotProduct": {
-                                        "$reduce": {
-                                            "input": {"$zip": {"inputs": ["$vector", query_vector]}},
-                                            "initialValue": 0.0,
-                                            "in": {
-                                                "$add": [
-                                                    "$$value",
-                                                    {"$multiply": [
-                                                        {"$arrayElemAt": ["$$this", 0]},
-                                                        {"$arrayElemAt": ["$$this", 1]}
-                                                    ]}
-                                                ]
-                                            }
-                                        }
-                                    }
-                                },
-                                "in": {
-                                    "$min": [1.0, {"$max": [0.0, "$$dotProduct"]}]
-                                }
-                            }
-                        }
-                    }
-                },
-                {"$match": {"similarity": {"$gte": min_score}}},
-                {"$sort": {"similarity": -1}},
-                {"$limit": limit}
-            ]
+            # Let Atlas walk its ANN index; fall back to a scan if it has none.
+            # A missing or building index yields no results rather than an
+            # error, so check it is queryable first
+            if await database.is_vector_index_queryable(self.collection_name):
+                try:
+                    pipeline = self._vector_search_pipeline(query_vector, limit, min_score)
+                    return await coll.aggregate(pipeline).to_list(length=limit)
+                except OperationFailure as e:
+                    logger.warning(
+                        f"$vectorSearch unavailable on {self.collection_name}, "
+                        f"falling back to full scan: {e}"
+                    )
+            else:
+                logger.warning(
+                    f"Vector search index on {self.collection_name} is not queryable, "
+                    f"falling back to full scan"
+                )
             
-            results = await coll.aggregate(pipeline).to_list(length=limit)
-            return results
+            return await self._scan_search(coll, query_vector, limit, min_score)
         except Exception as e:
             logger.error(f"Error searching {self.collection_name}: {e}")
             raise
\ No newline at end of file
@@ -41,19 +41,15 @@ class ChatService:
             # Add logging to see what we're querying
             logger.info(f"Fetching chat history for {content_type} {content_id}")
         
-            # Fetch documents
-            cursor = coll.find({
+            # Fetch the whole page of documents in one batch
+            documents = await coll.find({
                 "content_id": content_id,
                 "content_type": content_type
-            }).sort("timestamp", -1).limit(limit)
+            }).sort("timestamp", -1).to_list(length=limit)
 
             # Convert to list and log count
-            # OLD version
-            # messages = [ChatMessage(**doc) async for doc in cursor]
-
-            # NEW version
             messages = []
-            async for doc in cursor:
+            for doc in documents:
                 try:
                     # Ensure timestamp is present
                     if "timestamp" not in doc:
@@ -129,7 +125,7 @@ class ChatService:
                 "findings": findings,
                 "relevant_section": await self._find_relevant_section(study.text, question),
                 "confidence_score": 0.85,  # Add confidence score
-                "analysis_timestamp": datetime.utcnow()
+                "timestamp": datetime.utcnow()
             }
             
             logger.info(f"Successfully analyzed study {study_id}")
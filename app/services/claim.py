@@ -3,8 +3,9 @@ import logging
 from app.models.models import Claim, ScientificStudy
 from app.core.database import database, Collection
 from .scientific_study import scientific_study_service
+from .vector_service import get_model_bundle
 import torch
-from transformers import AutoModelForSequenceClassification, AutoTokenizer
+from transformers import AutoModelForSequenceClassification
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -15,11 +16,13 @@ class ClaimService:
     def __init__(self):
         """Initialize the claim verification service."""
         self.settings = database.settings
-        self.tokenizer = AutoTokenizer.from_pretrained(self.settings.MODEL_NAME)
+        # Same vocabulary as the embedding model, so share its tokenizer
+        self.tokenizer = get_model_bundle(self.settings.MODEL_NAME).tokenizer
         self.verifier_model = AutoModelForSequenceClassification.from_pretrained(
             self.settings.MODEL_NAME,
             num_labels=2  # support/contradict
         )
+        self.verifier_model.eval()
     
     async def extract_claims(self, text: str) -> List[Claim]:
         """Extract scientific claims from text."""
@@ -69,7 +72,7 @@ class ClaimService:
                 )
                 
                 # Get model prediction
-                with torch.no_grad():
+                with torch.inference_mode():
                     outputs = self.verifier_model(**inputs)
                     probabilities = torch.softmax(outputs.logits, dim=1)
                     support_score = probabilities[0][1].item()
@@ -169,7 +169,7 @@ class PDFDocumentService(BaseService[PDFDocument]):
         """Find a document by its MD5 hash."""
         coll = await self.get_collection()
         doc = await coll.find_one({'md5_hash': md5_hash})
-        return PDFDocument(**doc) if doc else None
+        return PDFDocument.from_mongo(doc) if doc else None
     
     async def link_to_scientific_study(
         self,
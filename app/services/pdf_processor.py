@@ -22,6 +22,8 @@ class PDFProcessor:
         """
         Extract text content from a PDF file using pdfplumber.
         
+        Extraction stops once PDF_MAX_TEXT_CHARS characters have been read.
+        
         Args:
             file_path: Path to the PDF file
             
@@ -40,6 +42,8 @@ class PDFProcessor:
         try:
             logger.info(f"Starting text extraction from: {file_path}")
             text_content = []
+            char_count = 0
+            max_chars = self.settings.PDF_MAX_TEXT_CHARS
             
             with pdfplumber.open(file_path) as pdf:
                 total_pages = len(pdf.pages)
@@ -50,10 +54,19 @@ class PDFProcessor:
                     text = page.extract_text()
                     if text:
                         text_content.append(text)
+                        char_count += len(text)
                     else:
                         logger.warning(f"No text extracted from page {page_num}")
+                    
+                    # Later pages would only be tokenized and thrown away
+                    if char_count >= max_chars:
+                        logger.warning(
+                            f"Stopping after page {page_num}/{total_pages}: "
+                            f"text exceeds {max_chars} characters"
+                        )
+                        break
 
-            full_text = "\n\n".join(text_content)
+            full_text = "\n\n".join(text_content)[:max_chars]
             logger.info(f"Successfully extracted {len(full_text)} characters")
             return full_text
 
@@ -4,8 +4,8 @@ import logging
 from bson import ObjectId
 from app.core.database import Collection
 from app.models.models import ScientificStudy, SearchResponse
+from app.core.http_client import http_client
 from .base import BaseService
-import aiohttp
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -21,17 +21,17 @@ class ScientificStudyService(BaseService[ScientificStudy]):
     async def fetch_doi_metadata(self, doi: str) -> Dict[str, Any]:
         """Fetch metadata for a DOI from CrossRef API."""
         try:
-            async with aiohttp.ClientSession() as session:
-                url = f"https://api.crossref.org/works/{doi}"
-                headers = {"Accept": "application/json"}
-                
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data["message"]
-                    else:
-                        logger.warning(f"Failed to fetch DOI metadata: {response.status}")
-                        return {}
+            session = await http_client.get_session()
+            url = f"https://api.crossref.org/works/{doi}"
+            headers = {"Accept": "application/json"}
+            
+            async with session.get(url, headers=headers) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return data["message"]
+                else:
+                    logger.warning(f"Failed to fetch DOI metadata: {response.status}")
+                    return {}
         except Exception as e:
             logger.error(f"Error fetching DOI metadata: {e}")
             return {}
@@ -62,8 +62,11 @@ class ScientificStudyService(BaseService[ScientificStudy]):
         """Search for scientific studies by discipline."""
         try:
             coll = await self.get_collection()
-            cursor = coll.find({"discipline": discipline}).limit(limit)
-            return [ScientificStudy(**doc) async for doc in cursor]
+            documents = await coll.find(
+                {"discipline": discipline},
+                projection={"vector": 0}
+            ).to_list(length=limit)
+            return [ScientificStudy.from_mongo(doc) for doc in documents]
         except Exception as e:
             logger.error(f"Error searching by discipline: {e}")
             raise HTTPException(
@@ -83,7 +86,7 @@ class ScientificStudyService(BaseService[ScientificStudy]):
             
             return [
                 SearchResponse(
-                    content=ScientificStudy(**{k: v for k, v in doc.items() if k != "similarity"}),
+                    content=ScientificStudy.from_mongo(doc),
                     score=doc["similarity"],
                     content_type="scientific_study"
                 )
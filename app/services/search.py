@@ -1,5 +1,7 @@
 from typing import List, Dict, Any, Optional
 import logging
+from pymongo.errors import OperationFailure
+from app.core.database import database, Collection
 from app.models.models import SearchQuery, SearchResponse, ScientificStudy, Article
 from .scientific_study import scientific_study_service
 from .article import article_service
@@ -21,7 +23,19 @@ class SearchService:
             elif query.content_type == "article":
                 results.extend(await self._search_articles(query))
             else:
-                # Search both collections if no specific type is requested
+                # Let Atlas merge, sort and limit both collections in one query;
+                # an index that is not queryable would silently return nothing
+                if (
+                    await database.is_vector_index_queryable(Collection.SCIENTIFIC_STUDIES)
+                    and await database.is_vector_index_queryable(Collection.ARTICLES)
+                ):
+                    try:
+                        return await self._search_union(query)
+                    except OperationFailure as e:
+                        logger.warning(
+                            f"$unionWith vector search unavailable, "
+                            f"searching collections separately: {e}"
+                        )
                 results.extend(await self._search_scientific_studies(query))
                 results.extend(await self._search_articles(query))
             
@@ -34,6 +48,49 @@ class SearchService:
             logger.error(f"Error performing cross-collection search: {e}")
             raise
 
+    async def _search_union(self, query: SearchQuery) -> List[SearchResponse]:
+        """Search studies and articles with a single $unionWith aggregation."""
+        query_vector = await scientific_study_service.generate_embedding(query.query_text)
+        if query_vector is None:
+            raise ValueError("Failed to generate query vector")
+        
+        study_stages = scientific_study_service._vector_search_pipeline(
+            query_vector, query.limit, query.min_score
+        )
+        article_stages = article_service._vector_search_pipeline(
+            query_vector, query.limit, query.min_score
+        )
+        pipeline = [
+            *study_stages,
+            {"$addFields": {"content_type": "scientific_study"}},
+            {
+                "$unionWith": {
+                    "coll": Collection.ARTICLES.value,
+                    "pipeline": [
+                        *article_stages,
+                        {"$addFields": {"content_type": "article"}}
+                    ]
+                }
+            },
+            {"$sort": {"similarity": -1}},
+            {"$limit": query.limit}
+        ]
+        
+        coll = await database.get_collection(Collection.SCIENTIFIC_STUDIES)
+        documents = await coll.aggregate(pipeline).to_list(length=query.limit)
+        
+        models = {"scientific_study": ScientificStudy, "article": Article}
+        results = []
+        for doc in documents:
+            score = doc.pop("similarity")
+            content_type = doc.pop("content_type")
+            results.append(SearchResponse(
+                content=models[content_type].from_mongo(doc),
+                score=score,
+                content_type=content_type
+            ))
+        return results
+
     async def _search_scientific_studies(
         self,
         query: SearchQuery
@@ -118,7 +175,7 @@ class SearchService:
         """Find content related to a specific item."""
         try:
             if content_type == "scientific_study":
-                study = await scientific_study_service.get_by_id(content_id)
+                study = await scientific_study_service.get_by_id(content_id, projection={"text": 1})
                 if not study:
                     raise ValueError("Scientific study not found")
                 
@@ -137,7 +194,7 @@ class SearchService:
                 }
             
             elif content_type == "article":
-                article = await article_service.get_by_id(content_id)
+                article = await article_service.get_by_id(content_id, projection={"text": 1})
                 if not article:
                     raise ValueError("Article not found")
                 
@@ -1,15 +0,0 @@
-from .base import BaseService
-from .scientific_study import scientific_study_service
-from .article import article_service
-from .claim import claim_service
-from .chat import chat_service
-from .search import search_service
-
-__all__ = [
-    'BaseService',
-    'scientific_study_service',
-    'article_service',
-    'claim_service',
-    'chat_service',
-    'search_service'
-]
\ No newline at end of file
@@ -1,17 +1,54 @@
+import asyncio
+import copy
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Let the Rust tokenizer use its thread pool; respects an explicit override
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
+
 from transformers import AutoTokenizer, AutoModel
 import torch
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional, Union
 import logging
 from dataclasses import dataclass
 from datetime import datetime
-from app.core.config import get_settings
+from app.core.config import Settings, get_settings
+from functools import lru_cache
 from app.core.cache_manager import cache_manager
+from collections import OrderedDict
+import hashlib
 import numpy as np
 import time
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Allow TF32 matmuls on Ampere+ GPUs; no effect on CPU
+torch.set_float32_matmul_precision("high")
+
+# Sequence lengths a compiled model pads to, so it only sees a few shapes
+PADDING_BUCKETS = (16, 64, 128, 256, 512)
+
+# Forward passes per bucket at startup; CUDA graphs are recorded on a repeat call
+WARMUP_ITERATIONS = 3
+
+# Concurrent chunk requests are coalesced into batches of up to this many
+BATCH_MAX_SIZE = 32
+
+# How long the batcher waits for more requests before running a batch (seconds)
+BATCH_MAX_WAIT = 0.005
+
+# Threads running forward passes off the event loop. The batcher runs one
+# batch at a time and torch spreads each pass over its own intra-op threads,
+# so a single thread keeps the loop free without oversubscribing the CPU
+EXECUTOR_WORKERS = 1
+
+# Chunk embeddings kept in memory so repeated text skips the model
+EMBEDDING_CACHE_SIZE = 4096
+
+# Whole-text embeddings kept so repeated queries skip chunking and tokenizing
+TEXT_CACHE_SIZE = 4096
+
 @dataclass
 class ProcessingMetrics:
     """Tracks metrics for text processing operations.
@@ -29,6 +66,111 @@ class ProcessingMetrics:
     success: bool
     error_message: str = ""
 
+@dataclass
+class ModelBundle:
+    """Tokenizer and prepared encoder shared by every VectorService.
+    
+    Attributes:
+        tokenizer: Fast tokenizer for the model
+        model: Encoder in eval mode on its device
+        device: Device the model runs on
+        dtype: Weight dtype of the model
+        compiled: Whether the model was wrapped in torch.compile
+    """
+    tokenizer: Any
+    model: Any
+    device: torch.device
+    dtype: torch.dtype
+    compiled: bool = False
+
+def _select_dtype(settings: Settings, device: torch.device) -> torch.dtype:
+    """Pick the weight dtype for the embedding model.
+    
+    bfloat16 halves the memory traffic of every forward pass and keeps
+    float32's exponent range, so pooled embeddings stay well conditioned.
+    """
+    if settings.MODEL_DTYPE == "bfloat16":
+        return torch.bfloat16
+    if settings.MODEL_DTYPE == "auto" and device.type == "cuda" and torch.cuda.is_bf16_supported():
+        return torch.bfloat16
+    return torch.float32
+
+@lru_cache(maxsize=1)
+def get_model_bundle(model_name: str) -> ModelBundle:
+    """Load and prepare the embedding model once per process.
+    
+    Args:
+        model_name: Hugging Face model name
+        
+    Returns:
+        The shared model bundle
+    """
+    settings = get_settings()
+
+    # Check cache status before loading models
+    cache_stats = cache_manager.get_cache_stats(force_check=True)
+    if cache_stats.get('total', {}).get('size_gb', 0) >= cache_manager.MAX_CACHE_SIZE_GB:
+        logger.warning("Cache size exceeds limit. Consider clearing cache.")
+    
+    # Load language models with retries
+    max_retries = 3
+    retry_count = 0
+    
+    while retry_count < max_retries:
+        try:
+            logger.info(f"Loading model: {model_name} (attempt {retry_count + 1})")
+            tokenizer = AutoTokenizer.from_pretrained(
+                model_name,
+                cache_dir=str(settings.MODEL_CACHE_DIR),
+                use_fast=True,  # Rust tokenizer; also required for offset mappings
+                local_files_only=False # Allow downloading if NOT in cache
+            )
+            model = AutoModel.from_pretrained(
+                model_name,
+                cache_dir=str(settings.MODEL_CACHE_DIR),
+                local_files_only=False # Allow downloading if NOT in cache
+            )
+            logger.info("Models loaded successfully")
+            break
+        except Exception as e:
+            retry_count += 1
+            if retry_count == max_retries:
+                logger.error(f"Failed to load models: {e}")
+                raise
+            logger.warning(f"Attempt {retry_count} failed, retrying...")
+
+            # Clear model cache if we're having issues
+            if retry_count == max_retries - 1:
+                logger.warning("Clearing model cache and trying one last time")
+                cache_manager.clear_cache("model")
+            time.sleep(1)  # Wait before retrying
+    
+    # Set device (GPU if available)
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    dtype = _select_dtype(settings, device)
+    model.to(device, dtype=dtype)
+    model.eval()  # Disable dropout so pooling is deterministic
+    logger.info(f"Using device: {device} ({dtype})")
+    
+    # Int8 GEMMs roughly halve CPU latency; vectors drift slightly from
+    # float32 ones, so stored embeddings should be regenerated after enabling
+    if settings.MODEL_QUANTIZE_CPU and device.type == "cpu" and dtype == torch.float32:
+        model = torch.ao.quantization.quantize_dynamic(
+            model,
+            {torch.nn.Linear},
+            dtype=torch.qint8
+        )
+        logger.info("Quantized embedding model linear layers to int8")
+    
+    # Fuse the encoder's kernels and replay them as CUDA graphs, which skips
+    # per-kernel launch overhead; graphs are recorded during warm-up
+    compiled = settings.MODEL_COMPILE and device.type == "cuda"
+    if compiled:
+        model = torch.compile(model, mode="reduce-overhead", dynamic=True)
+        logger.info("Compiled embedding model with torch.compile (reduce-overhead)")
+    
+    return ModelBundle(tokenizer=tokenizer, model=model, device=device, dtype=dtype, compiled=compiled)
+
 class VectorService:
     """Service for converting text into vector embeddings.
     
@@ -38,54 +180,97 @@ class VectorService:
     """
     
     def __init__(self):
-        """Initialize the vector service with required models."""
+        """Initialize the vector service with the shared model."""
         logger.info("Initializing VectorService")
         self.settings = get_settings()
+        
+        # Reuse the process-wide model; only the first service pays for loading
+        bundle = get_model_bundle(self.settings.MODEL_NAME)
+        # Fast tokenizers hold per-call truncation and padding state and are
+        # not safe to share across threads, so each service gets its own copy
+        # and only ever calls it on its executor thread
+        self.tokenizer = copy.deepcopy(bundle.tokenizer)
+        self.model = bundle.model
+        self.device = bundle.device
+        self.dtype = bundle.dtype
+        self.compiled = bundle.compiled
+        
+        # Initialize metrics storage
+        self.metrics: Dict[str, ProcessingMetrics] = {}
+        
+        # LRU cache of chunk embeddings keyed by a hash of the chunk text
+        self._embedding_cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        
+        # LRU cache of final embeddings keyed by a hash of the raw input text
+        self._text_cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        
+        # Queue feeding the batching worker; created on the running event loop
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._batch_task: Optional[asyncio.Task] = None
+        
+        # Tokenizing and forward passes run here so they never block the event loop
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the thread that tokenizes and runs forward passes, creating it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=EXECUTOR_WORKERS,
+                thread_name_prefix="embed"
+            )
+        return self._executor
 
-        # Check cache status before loading models
-        cache_stats = cache_manager.get_cache_stats(force_check=True)
-        if cache_stats.get('total', {}).get('size_gb', 0) >= cache_manager.MAX_CACHE_SIZE_GB:
-            logger.warning("Cache size exceeds limit. Consider clearing cache.")
+    async def start(self) -> None:
+        """Warm the model up on the executor thread that serves batches.
         
-        # Load language models with retries
-        max_retries = 3
-        retry_count = 0
+        Inductor keeps CUDA graphs per thread, so graphs recorded on any
+        other thread would never be replayed by live requests.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._get_executor(), self.warmup)
+
+    def warmup(self) -> None:
+        """Run forward passes at every padding bucket.
         
-        while retry_count < max_retries:
-            try:
-                logger.info(f"Loading model: {self.settings.MODEL_NAME} (attempt {retry_count + 1})")
-                self.tokenizer = AutoTokenizer.from_pretrained(
-                    self.settings.MODEL_NAME,
-                    cache_dir=str(self.settings.MODEL_CACHE_DIR),
-                    local_files_only=False # Allow downloading if NOT in cache
-                )
-                self.model = AutoModel.from_pretrained(
-                    self.settings.MODEL_NAME,
-                    cache_dir=str(self.settings.MODEL_CACHE_DIR),
-                    local_files_only=False # Allow downloading if NOT in cache
+        The first forward pass pays for kernel selection, thread pool startup
+        and workspace allocation, and a compiled model also compiles and
+        records a CUDA graph per shape; doing it here keeps that cost off
+        the first real requests.
+        """
+        start_time = time.perf_counter()
+        try:
+            for length in PADDING_BUCKETS:
+                sample = self.tokenizer(
+                    "x " * length,
+                    padding="max_length",
+                    truncation=True,
+                    return_tensors="pt",
+                    max_length=length
                 )
-                logger.info("Models loaded successfully")
-                break
-            except Exception as e:
-                retry_count += 1
-                if retry_count == max_retries:
-                    logger.error(f"Failed to load models: {e}")
-                    raise
-                logger.warning(f"Attempt {retry_count} failed, retrying...")
-
-                # Clear model cache if we're having issues
-                if retry_count == max_retries - 1:
-                    logger.warning("Clearing model cache and trying one last time")
-                    cache_manager.clear_cache("model")
-                time.sleep(1)  # Wait before retrying
+                sample = {k: v.to(self.device) for k, v in sample.items()}
+                for _ in range(WARMUP_ITERATIONS if self.compiled else 1):
+                    with torch.inference_mode():
+                        self.model(**sample)
+            logger.info(f"Model warm-up finished in {time.perf_counter() - start_time:.2f}s")
+        except Exception as e:
+            # A failed warm-up only costs latency on the first request
+            logger.warning(f"Model warm-up failed: {e}")
+
+    def _pad_to_bucket(self, inputs: Dict[str, torch.Tensor]) -> Dict[str, torch.Tensor]:
+        """Right-pad a tokenized batch to the next padding bucket length.
         
-        # Initialize metrics storage
-        self.metrics: Dict[str, ProcessingMetrics] = {}
+        Padded positions are masked out, so pooled embeddings are unchanged.
+        """
+        length = inputs["input_ids"].shape[1]
+        bucket = next((b for b in PADDING_BUCKETS if b >= length), length)
+        if bucket == length:
+            return inputs
         
-        # Set device (GPU if available)
-        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-        self.model.to(self.device)
-        logger.info(f"Using device: {self.device}")
+        pad_values = {"input_ids": self.tokenizer.pad_token_id or 0}
+        return {
+            k: torch.nn.functional.pad(v, (0, bucket - length), value=pad_values.get(k, 0))
+            for k, v in inputs.items()
+        }
 
     async def _preprocess_text(self, text: str) -> str:
         """Clean and normalize text before processing.
@@ -110,98 +295,290 @@ class VectorService:
         logger.debug(f"Preprocessing complete. New length: {len(text)}")
         return text
 
-    def _chunk_text(self, text: str, chunk_size: int = 512) -> List[str]:
-        """Split text into overlapping chunks for processing.
+    def _chunk_text(self, text: str, chunk_size: int = 510) -> List[str]:
+        """Split text into overlapping chunks of at most chunk_size tokens.
         
         Args:
             text: Input text to chunk
-            chunk_size: Maximum size of each chunk
+            chunk_size: Maximum number of tokens in each chunk
             
         Returns:
             List of text chunks
         """
-        words = text.split()
-        chunks = []
-        overlap = min(50, chunk_size // 10)  # 10% overlap, max 50 words
-        
-        for i in range(0, len(words), chunk_size - overlap):
-            chunk = words[i:i + chunk_size]
-            chunk_text = " ".join(chunk)
-            chunks.append(chunk_text)
-            
-        logger.debug(f"Split text into {len(chunks)} chunks")
-        return chunks
+        return self._chunk_texts([text], chunk_size)[0]
 
-    async def _generate_chunk_embedding(self, chunk: str) -> torch.Tensor:
-        """Generate embedding for a single chunk of text.
+    async def _chunk_texts_on_executor(self, texts: List[str]) -> List[List[str]]:
+        """Chunk texts on the executor thread, the only thread using the tokenizer."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._get_executor(),
+            self._chunk_texts,
+            texts
+        )
+
+    def _chunk_texts(self, texts: List[str], chunk_size: int = 510) -> List[List[str]]:
+        """Split several texts into overlapping chunks of at most chunk_size tokens.
+        
+        All texts go through the tokenizer in one batched call. Windows are
+        taken over its output and mapped back to the original string through
+        character offsets, so every chunk fits the model (510 tokens plus
+        [CLS] and [SEP]) and no text is truncated away.
         
         Args:
-            chunk: Text chunk to process
+            texts: Input texts to chunk
+            chunk_size: Maximum number of tokens in each chunk
             
         Returns:
-            Tensor containing chunk embedding
+            One list of text chunks per input text
         """
-        try:
-            # Prepare input
-            inputs = self.tokenizer(
-                chunk,
-                padding=True,
-                truncation=True,
-                return_tensors="pt",
-                max_length=512
-            )
+        if not texts:
+            return []
+        
+        offset_mappings = self.tokenizer(
+            texts,
+            add_special_tokens=False,
+            return_offsets_mapping=True,
+            verbose=False  # Long inputs are expected here; we window them ourselves
+        )["offset_mapping"]
+        overlap = min(50, chunk_size // 10)  # 10% overlap, max 50 tokens
+        
+        chunked = []
+        for text, offsets in zip(texts, offset_mappings):
+            chunks = []
+            for start in range(0, len(offsets), chunk_size - overlap):
+                end = min(start + chunk_size, len(offsets))
+                chunks.append(text[offsets[start][0]:offsets[end - 1][1]])
+                if end == len(offsets):
+                    break
+            chunked.append(chunks)
             
-            # Move inputs to device
-            inputs = {k: v.to(self.device) for k, v in inputs.items()}
+        logger.debug(f"Split {len(texts)} texts into {sum(map(len, chunked))} chunks")
+        return chunked
+
+    @staticmethod
+    def _mean_pool(hidden: torch.Tensor, attention_mask: torch.Tensor) -> torch.Tensor:
+        """Average token embeddings, ignoring padding positions.
+        
+        Args:
+            hidden: Last hidden state of shape (batch, tokens, dim)
+            attention_mask: Mask of shape (batch, tokens), 1 for real tokens
             
-            # Generate embedding
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-                embeddings = outputs.last_hidden_state.mean(dim=1)
-                
-            # Normalize embedding
-            normalized = torch.nn.functional.normalize(embeddings)
+        Returns:
+            Tensor of shape (batch, dim)
+        """
+        mask = attention_mask.unsqueeze(-1).to(hidden.dtype)
+        return (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)
+
+    def _forward(self, encodings: Dict[str, List[List[int]]]) -> torch.Tensor:
+        """Pad tokenized chunks into one batch and embed them.
+        
+        Args:
+            encodings: Tokenizer output without padding, one list per chunk
             
-            return normalized
+        Returns:
+            Tensor of shape (chunks, dim) with normalized embeddings
+        """
+        # Pad to the longest chunk in the batch
+        inputs = dict(self.tokenizer.pad(encodings, padding="longest", return_tensors="pt"))
+        
+        # A compiled model replays one CUDA graph per shape; keep shapes few
+        if self.compiled:
+            inputs = self._pad_to_bucket(inputs)
+        
+        # Move inputs to device
+        inputs = {k: v.to(self.device) for k, v in inputs.items()}
+        
+        # Generate embeddings
+        with torch.inference_mode():
+            outputs = self.model(**inputs)
+            embeddings = self._mean_pool(
+                outputs.last_hidden_state.float(),
+                inputs["attention_mask"]
+            )
             
+        # Normalize embeddings
+        return torch.nn.functional.normalize(embeddings)
+
+    def _ensure_batch_worker(self) -> asyncio.Queue:
+        """Start the batching worker on the running loop if it is not running."""
+        if self._batch_task is None or self._batch_task.done() or (
+            self._batch_task.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._batch_queue = asyncio.Queue()
+            self._batch_task = asyncio.create_task(self._batch_worker(self._batch_queue))
+        return self._batch_queue
+
+    async def _embed_chunk(self, chunk: str) -> np.ndarray:
+        """Queue a chunk for the batching worker and wait for its embedding."""
+        future = asyncio.get_running_loop().create_future()
+        self._ensure_batch_worker().put_nowait((chunk, future))
+        return await future
+
+    async def _batch_worker(self, queue: asyncio.Queue) -> None:
+        """Collect queued chunks into batches and embed them.
+        
+        A batch runs once it holds BATCH_MAX_SIZE chunks or BATCH_MAX_WAIT has
+        passed since its first chunk arrived, so concurrent requests share
+        forward passes instead of each running its own.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = [await queue.get()]
+            deadline = loop.time() + BATCH_MAX_WAIT
+            while len(pending) < BATCH_MAX_SIZE:
+                if not queue.empty():
+                    pending.append(queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    pending.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            await self._run_batch(pending)
+
+    async def _run_batch(self, pending: List[tuple]) -> None:
+        """Embed queued chunks on the executor and resolve their futures."""
+        pending = [(chunk, future) for chunk, future in pending if not future.done()]
+        if not pending:
+            return
+        
+        try:
+            rows = await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(),
+                self._embed_batch,
+                [chunk for chunk, _ in pending]
+            )
+            for (_, future), row in zip(pending, rows):
+                if not future.done():
+                    future.set_result(row)
         except Exception as e:
-            logger.error(f"Error generating chunk embedding: {e}")
-            raise
+            logger.error(f"Error embedding batch of {len(pending)} chunks: {e}")
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+
+    def _embed_batch(self, chunks: List[str]) -> List[np.ndarray]:
+        """Embed chunks, one forward pass per length bucket.
+        
+        Grouping by bucket means a short query is never padded to the length
+        of a long chunk that happened to arrive in the same window.
+        
+        Returns:
+            One normalized embedding per chunk, in input order
+        """
+        encodings = self.tokenizer(chunks, truncation=True, max_length=512)
+        
+        buckets: Dict[int, List[int]] = {}
+        for i, input_ids in enumerate(encodings["input_ids"]):
+            bucket = next((b for b in PADDING_BUCKETS if b >= len(input_ids)), PADDING_BUCKETS[-1])
+            buckets.setdefault(bucket, []).append(i)
+        
+        rows: List[Optional[np.ndarray]] = [None] * len(chunks)
+        for indices in buckets.values():
+            batch = {k: [encodings[k][i] for i in indices] for k in encodings.keys()}
+            embeddings = self._forward(batch).cpu().numpy()
+            for i, row in zip(indices, embeddings):
+                rows[i] = row
+        return rows
+
+    async def shutdown(self) -> None:
+        """Stop the batching worker and its executor."""
+        if self._batch_task is not None and not self._batch_task.done():
+            self._batch_task.cancel()
+            try:
+                await self._batch_task
+            except asyncio.CancelledError:
+                pass
+        self._batch_task = None
+        self._batch_queue = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
 
-    def _combine_embeddings(self, embeddings: List[torch.Tensor]) -> List[float]:
+    @staticmethod
+    def _cache_key(text: str) -> bytes:
+        """Hash text into a compact cache key."""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    async def generate_embeddings(self, texts: List[str]) -> np.ndarray:
+        """Generate embeddings for many chunks.
+        
+        Chunks seen recently are served from the embedding cache; the misses
+        are queued for the batching worker, which shares forward passes with
+        any other requests in flight.
+        
+        Args:
+            texts: Chunks to embed; each is truncated to the model's 512 tokens
+            
+        Returns:
+            Array of shape (len(texts), dim) with one normalized row per text
+        """
+        keys = [self._cache_key(text) for text in texts]
+        embeddings: Dict[bytes, np.ndarray] = {}
+        misses: Dict[bytes, str] = {}
+        
+        for key, text in zip(keys, texts):
+            cached = self._embedding_cache.get(key)
+            if cached is not None:
+                self._embedding_cache.move_to_end(key)
+                embeddings[key] = cached
+            else:
+                misses[key] = text
+        
+        miss_keys = list(misses)
+        rows = await asyncio.gather(*(self._embed_chunk(misses[key]) for key in miss_keys))
+        for key, row in zip(miss_keys, rows):
+            # Cached rows are shared between callers, so freeze them
+            row.setflags(write=False)
+            embeddings[key] = row
+            self._embedding_cache[key] = row
+            if len(self._embedding_cache) > EMBEDDING_CACHE_SIZE:
+                self._embedding_cache.popitem(last=False)
+        
+        return np.stack([embeddings[key] for key in keys])
+
+    def _combine_embeddings(self, embeddings: np.ndarray) -> np.ndarray:
         """Combine multiple chunk embeddings into a single embedding.
         
         Args:
-            embeddings: List of chunk embeddings
+            embeddings: Chunk embeddings of shape (chunks, dim)
             
         Returns:
-            Combined embedding as list of floats
+            Combined unit-length float32 embedding of shape (dim,)
         """
         try:
-            # Stack embeddings
-            stacked = torch.stack(embeddings)
-            
-            # Average across chunks
-            averaged = torch.mean(stacked, dim=0)
-            
-            # Convert to list
-            return averaged.squeeze().cpu().tolist()
+            # Average across chunks, then renormalize: a mean of unit vectors
+            # is shorter than 1, and every search treats a dot product as cosine
+            averaged = embeddings.mean(axis=0)
+            return averaged / max(np.linalg.norm(averaged), 1e-12)
             
         except Exception as e:
             logger.error(f"Error combining embeddings: {e}")
             raise
 
-    async def generate_embedding(self, text: str) -> Optional[List[float]]:
+    async def generate_embedding(self, text: str) -> Optional[np.ndarray]:
         """Generate vector embedding for input text.
         
-        This is the main public method for converting text to vectors.
+        This is the main public method for converting text to vectors. The
+        result stays a float32 array; it is packed straight into BSON when
+        stored, so it never needs to become a list of Python floats.
         
         Args:
             text: Input text to vectorize
             
+        Repeated texts, typically search queries, are answered from an LRU
+        cache; the cached arrays are read-only and shared between callers.
+        
         Returns:
-            Vector embedding as list of floats, or None if processing fails
+            Vector embedding as a float32 array, or None if processing fails
         """
+        cache_key = self._cache_key(text)
+        cached = self._text_cache.get(cache_key)
+        if cached is not None:
+            self._text_cache.move_to_end(cache_key)
+            return cached
+        
         start_time = datetime.now()
         text_id = text[:50]  # Use first 50 chars as ID
         
@@ -210,16 +587,17 @@ class VectorService:
             text = await self._preprocess_text(text)
             
             # Split into chunks
-            chunks = self._chunk_text(text)
+            chunks = (await self._chunk_texts_on_executor([text]))[0]
             
-            # Process each chunk
-            embeddings = []
-            for chunk in chunks:
-                embedding = await self._generate_chunk_embedding(chunk)
-                embeddings.append(embedding)
+            # Embed all chunks in batched forward passes
+            embeddings = await self.generate_embeddings(chunks)
             
             # Combine chunk embeddings
             final_embedding = self._combine_embeddings(embeddings)
+            final_embedding.setflags(write=False)
+            self._text_cache[cache_key] = final_embedding
+            if len(self._text_cache) > TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
             
             # Record metrics
             processing_time = (datetime.now() - start_time).total_seconds()
@@ -244,6 +622,50 @@ class VectorService:
             logger.error(f"Failed to generate embedding: {e}")
             return None
 
+    async def generate_text_embeddings(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """Generate embeddings for several texts with shared forward passes.
+        
+        Chunks from all texts are embedded together, so a batch of short
+        documents costs a few full forward passes instead of one each.
+        
+        Args:
+            texts: Input texts to vectorize
+            
+        Returns:
+            One float32 embedding per text, or None where a text has no content
+        """
+        start_time = datetime.now()
+        
+        try:
+            cleaned = [await self._preprocess_text(text) for text in texts]
+            chunked = await self._chunk_texts_on_executor(cleaned)
+            flat_chunks = [chunk for chunks in chunked for chunk in chunks]
+            embeddings = await self.generate_embeddings(flat_chunks) if flat_chunks else None
+            
+            results: List[Optional[np.ndarray]] = []
+            offset = 0
+            processing_time = (datetime.now() - start_time).total_seconds()
+            for text, chunks in zip(cleaned, chunked):
+                if chunks:
+                    results.append(self._combine_embeddings(embeddings[offset:offset + len(chunks)]))
+                else:
+                    results.append(None)
+                offset += len(chunks)
+                
+                self.metrics[text[:50]] = ProcessingMetrics(
+                    chunk_count=len(chunks),
+                    processing_time=processing_time,
+                    input_length=len(text),
+                    success=bool(chunks),
+                    error_message="" if chunks else "No text to embed"
+                )
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"Failed to generate embeddings for {len(texts)} texts: {e}")
+            return [None] * len(texts)
+
     async def get_processing_metrics(self) -> Dict[str, ProcessingMetrics]:
         """Retrieve processing metrics for monitoring and debugging.
         
@@ -254,8 +676,8 @@ class VectorService:
 
     async def calculate_similarity(
         self,
-        embedding1: List[float],
-        embedding2: List[float]
+        embedding1: Union[np.ndarray, List[float]],
+        embedding2: Union[np.ndarray, List[float]]
     ) -> float:
         """Calculate cosine similarity between two embeddings.
         
@@ -267,9 +689,9 @@ class VectorService:
             Similarity score between 0 and 1
         """
         try:
-            # Convert to numpy arrays
-            vec1 = np.array(embedding1)
-            vec2 = np.array(embedding2)
+            # Convert to float32 numpy arrays
+            vec1 = np.asarray(embedding1, dtype=np.float32)
+            vec2 = np.asarray(embedding2, dtype=np.float32)
             
             # Calculate cosine similarity
             similarity = np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2))
@@ -31,6 +31,35 @@ async def test_create_article(async_client: AsyncClient):
     created_article = get_response.json()
     assert created_article["title"] == article_data["title"]
 
+async def test_create_articles_bulk(async_client: AsyncClient):
+    """Test creating several articles in one request."""
+    articles_data = [
+        {
+            "title": f"Bulk Article {n}",
+            "text": f"Bulk article number {n} about AI research.",
+            "author": "John Journalist",
+            "publication_date": datetime.utcnow().isoformat(),
+            "source_url": f"https://example.com/bulk-{n}",
+            "publication_name": "Tech News",
+            "topic": "Artificial Intelligence",
+            "article_type": "news"
+        }
+        for n in range(2)
+    ]
+    
+    response = await async_client.post("/articles/bulk", json=articles_data)
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data["details"]["count"] == 2
+    
+    # Verify each article reads back with its URL intact
+    for article_id, article_data in zip(data["details"]["ids"], articles_data):
+        get_response = await async_client.get(f"/articles/{article_id}")
+        assert get_response.status_code == 200
+        created_article = get_response.json()
+        assert created_article["title"] == article_data["title"]
+        assert created_article["source_url"] == article_data["source_url"]
+
 async def test_get_nonexistent_article(async_client: AsyncClient):
     """Test retrieving a non-existent article."""
     fake_id = str(ObjectId())
@@ -74,6 +103,63 @@ async def test_update_article(async_client: AsyncClient):
     assert updated_article["title"] == "Updated Article"
     assert updated_article["text"] == "Updated text."
 
+async def test_update_article_with_missing_study(async_client: AsyncClient):
+    """Test updating an article that cites a non-existent study."""
+    article_data = {
+        "title": "Article Citing Studies",
+        "text": "Article text.",
+        "author": "John Journalist",
+        "publication_date": datetime.utcnow().isoformat(),
+        "source_url": "https://example.com/citing",
+        "publication_name": "Tech News",
+        "topic": "Technology",
+        "article_type": "news"
+    }
+    
+    create_response = await async_client.post("/articles/", json=article_data)
+    article_id = create_response.json()["details"]["id"]
+    
+    missing_id = str(ObjectId())
+    update_response = await async_client.put(
+        f"/articles/{article_id}",
+        json={**article_data, "related_scientific_studies": [missing_id]}
+    )
+    assert update_response.status_code == 404
+    assert missing_id in update_response.json()["detail"]
+
+async def test_update_article_with_uppercase_study_id(async_client: AsyncClient):
+    """Test that study ids match regardless of hex case."""
+    study_data = {
+        "title": "Cited Research",
+        "text": "Scientific study text.",
+        "authors": ["Researcher"],
+        "publication_date": datetime.utcnow().isoformat(),
+        "journal": "Science Journal",
+        "topic": "Research",
+        "discipline": "Science"
+    }
+    study_response = await async_client.post("/scientific-studies/", json=study_data)
+    study_id = study_response.json()["details"]["id"]
+    
+    article_data = {
+        "title": "Article Citing Research",
+        "text": "Article text.",
+        "author": "John Journalist",
+        "publication_date": datetime.utcnow().isoformat(),
+        "source_url": "https://example.com/citing-upper",
+        "publication_name": "Tech News",
+        "topic": "Technology",
+        "article_type": "news"
+    }
+    create_response = await async_client.post("/articles/", json=article_data)
+    article_id = create_response.json()["details"]["id"]
+    
+    update_response = await async_client.put(
+        f"/articles/{article_id}",
+        json={**article_data, "related_scientific_studies": [study_id.upper()]}
+    )
+    assert update_response.status_code == 200
+
 async def test_add_and_verify_claim(async_client: AsyncClient):
     """Test adding and verifying a claim in an article."""
     # Create an article
@@ -1,7 +1,7 @@
 # app/tests/api/test_chat_routes.py
 
 import pytest
-from httpx import AsyncClient
+from httpx import AsyncClient, ASGITransport
 from fastapi import FastAPI
 from datetime import datetime, timezone
 from app.api.routers.chat import router
@@ -12,6 +12,8 @@ import logging
 # Set up logging so we can see what's happening in our tests
 logger = logging.getLogger(__name__)
 
+pytestmark = pytest.mark.asyncio
+
 # Create a test app that we'll use to test our routes
 app = FastAPI()
 app.include_router(router)
@@ -20,7 +22,7 @@ app.include_router(router)
 @pytest.fixture
 async def client():
     """Create a test client that we can use to make requests."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         yield client
 
 class TestScientificStudyAnalysis:
@@ -31,6 +31,25 @@ async def test_create_scientific_study(async_client: AsyncClient):
     created_study = get_response.json()
     assert created_study["title"] == study_data["title"]
 
+async def test_create_scientific_study_with_malformed_vector(async_client: AsyncClient):
+    """Test that malformed vectors are rejected as validation errors."""
+    study_data = {
+        "title": "Malformed Vector Study",
+        "text": "Study text.",
+        "authors": ["John Doe"],
+        "publication_date": datetime.utcnow().isoformat(),
+        "journal": "Test Journal",
+        "topic": "Testing",
+        "discipline": "Computer Science"
+    }
+    
+    for vector in (5, [[1, 2], [3, 4]], {"a": 1}):
+        response = await async_client.post(
+            "/scientific-studies/",
+            json={**study_data, "vector": vector}
+        )
+        assert response.status_code == 422
+
 async def test_get_nonexistent_scientific_study(async_client: AsyncClient):
     """Test retrieving a non-existent scientific study."""
     fake_id = str(ObjectId())
@@ -53,12 +53,12 @@ async def create_test_data(async_client: AsyncClient):
         }
     ]
     
-    # Insert test data
-    for study in study_data:
-        await async_client.post("/scientific-studies/", json=study)
+    # Insert test data, one bulk request per collection
+    response = await async_client.post("/scientific-studies/bulk", json=study_data)
+    assert response.status_code == 200, f"Failed to create studies: {response.text}"
     
-    for article in article_data:
-        await async_client.post("/articles/", json=article)
+    response = await async_client.post("/articles/bulk", json=article_data)
+    assert response.status_code == 200, f"Failed to create articles: {response.text}"
 
 async def test_search_all_content(async_client: AsyncClient):
     """Test searching across all content types."""
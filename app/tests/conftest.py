@@ -1,10 +1,11 @@
 import pytest
+import pytest_asyncio
 import asyncio
-from typing import Generator, AsyncGenerator
-from fastapi.testclient import TestClient
-from httpx import AsyncClient
+from typing import AsyncGenerator
+from httpx import AsyncClient, ASGITransport
 from app.main import app
 from app.core.database import database, Collection
+from app.services import scientific_study_service, article_service
 import os
 from app.core.config import get_settings
 
@@ -22,52 +23,51 @@ def event_loop():
     yield loop
     loop.close()
 
-@pytest.fixture(scope="function")
+@pytest_asyncio.fixture(scope="session")
 async def initialized_app():
-    """Initialize app and database."""
+    """Initialize app and database once for the whole test session."""
     await database.connect()
+    # Search index calls are slow on Atlas, so make them once per worker
+    await database.ensure_vector_indexes()
     yield app
     await database.disconnect()
 
-@pytest.fixture(scope="function")
-def client(initialized_app) -> Generator:
-    """Create a TestClient instance."""
-    with TestClient(initialized_app) as test_client:
-        yield test_client
-
-@pytest.fixture(scope="function")
+@pytest_asyncio.fixture(scope="session")
 async def async_client(initialized_app) -> AsyncGenerator:
-    """Create an AsyncClient instance."""
+    """Create one AsyncClient shared by every test in the session."""
+    # ASGITransport calls the app in-process on the test's own event loop
     async with AsyncClient(
-        base_url="http://testserver",
-        app=initialized_app,
-        backend='asyncio'
+        transport=ASGITransport(app=initialized_app),
+        base_url="http://test"
     ) as ac:
         yield ac
 
 @pytest.fixture(autouse=True)
-async def clean_database():
-    """Clean database before and after each test."""
+async def clean_database(initialized_app):
+    """Empty the test collections before each test.
+    
+    delete_many keeps the Atlas vector indexes that initialized_app
+    created, where a drop would remove them. The next test's cleanup
+    makes a cleanup after each test unnecessary.
+    """
     settings = get_settings()
     if settings.ENV != "test":
         raise ValueError("Attempting to clean non-test database!")
     
-    # Ensure we're connected and clean before test
-    await database.connect()
+    # The session fixture holds the connection open for every test
     if database.is_connected:
         collections_to_clean = [
             Collection.SCIENTIFIC_STUDIES,
             Collection.ARTICLES,
             Collection.CHAT_HISTORY
         ]
-        for collection in collections_to_clean:
-            coll = await database.get_collection(collection)
-            await coll.delete_many({})
+        colls = [await database.get_collection(collection) for collection in collections_to_clean]
+        await asyncio.gather(*(coll.delete_many({}) for coll in colls))
     
-    yield
+    # Cached vectors from earlier tests would now point at nothing
+    for service in (scientific_study_service, article_service):
+        service.vector_cache.invalidate()
+        service.embedding_matrix.invalidate()
+        service.ann_index.invalidate()
     
-    # Clean after test
-    if database.is_connected:
-        for collection in collections_to_clean:
-            coll = await database.get_collection(collection)
-            await coll.delete_many({})
\ No newline at end of file
+    yield
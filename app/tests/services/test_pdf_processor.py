@@ -42,5 +42,36 @@ async def test_parse_pdf_date():
     # Test invalid date
     assert processor._parse_pdf_date("invalid_date") is None
 
+@pytest.mark.asyncio
+async def test_extract_text_stops_at_max_chars(pdf_processor, sample_pdf_path, monkeypatch):
+    """Test that extraction stops once the character cap is reached."""
+    sample_pdf_path.write_bytes(b"%PDF-1.4")
+    pages_read = []
+
+    class FakePage:
+        def __init__(self, number):
+            self.number = number
+
+        def extract_text(self):
+            pages_read.append(self.number)
+            return "x" * 40
+
+    class FakePDF:
+        pages = [FakePage(i) for i in range(10)]
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+    monkeypatch.setattr("app.services.pdf_processor.pdfplumber.open", lambda path: FakePDF())
+    monkeypatch.setattr(pdf_processor.settings, "PDF_MAX_TEXT_CHARS", 100)
+
+    text = await pdf_processor.extract_text(sample_pdf_path)
+
+    assert len(text) == 100
+    assert pages_read == [0, 1, 2]
+
 # Integration tests with real PDF files would go here
 # Note: You'll need to add test PDF files to your test directory
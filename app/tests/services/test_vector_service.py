@@ -1,12 +1,14 @@
 import pytest
 from app.services.vector_service import VectorService, ProcessingMetrics
-import torch
 import numpy as np
 
 @pytest.fixture
-def vector_service():
+async def vector_service():
     """Create a VectorService instance for testing."""
-    return VectorService()
+    service = VectorService()
+    yield service
+    # Stop the batching worker so no task outlives the test's event loop
+    await service.shutdown()
 
 class TestVectorService:
     """Test suite for VectorService functionality."""
@@ -66,16 +68,16 @@ class TestVectorService:
         """Test chunk embedding generation."""
         test_text = "This is a test chunk for embedding generation."
         
-        embedding = await vector_service._generate_chunk_embedding(test_text)
+        embedding = await vector_service.generate_embeddings([test_text])
         
         # Check embedding properties
-        assert isinstance(embedding, torch.Tensor)
-        assert embedding.dim() == 2  # Should be 2D tensor
-        assert embedding.size(0) == 1  # Batch size 1
+        assert isinstance(embedding, np.ndarray)
+        assert embedding.ndim == 2  # Should be 2D array
+        assert embedding.shape[0] == 1  # Batch size 1
         
         # Check normalization
-        norm = torch.norm(embedding)
-        assert torch.abs(norm - 1.0) < 1e-6  # Should be normalized
+        norm = np.linalg.norm(embedding)
+        assert abs(norm - 1.0) < 1e-6  # Should be normalized
 
     @pytest.mark.asyncio
     async def test_generate_embedding(self, vector_service):
@@ -89,9 +91,10 @@ class TestVectorService:
         embedding = await vector_service.generate_embedding(test_text)
         
         # Check embedding properties
-        assert isinstance(embedding, list)
+        assert isinstance(embedding, np.ndarray)
+        assert embedding.dtype == np.float32
+        assert embedding.ndim == 1
         assert len(embedding) > 0
-        assert all(isinstance(x, float) for x in embedding)
         
         # Check metrics were recorded
         metrics = await vector_service.get_processing_metrics()
@@ -200,4 +203,28 @@ class TestVectorService:
                     embeddings[i],
                     embeddings[j]
                 )
-                assert 0 <= similarity <= 1
\ No newline at end of file
+                assert 0 <= similarity <= 1
+
+    @pytest.mark.asyncio
+    async def test_generate_text_embeddings(self, vector_service):
+        """Test that batched embeddings match one-at-a-time embeddings."""
+        texts = [
+            "First text for batch processing test.",
+            "",
+            "Third text to ensure consistent processing."
+        ]
+        
+        embeddings = await vector_service.generate_text_embeddings(texts)
+        
+        assert len(embeddings) == len(texts)
+        assert embeddings[1] is None
+        
+        # A fresh service has empty caches, so each text really runs alone
+        single_service = VectorService()
+        try:
+            for text, embedding in zip(texts, embeddings):
+                if text:
+                    single = await single_service.generate_embedding(text)
+                    assert np.allclose(embedding, single, atol=1e-5)
+        finally:
+            await single_service.shutdown()
@@ -1,13 +1,13 @@
 import pytest
-from fastapi.testclient import TestClient
 from httpx import AsyncClient
 from bson import ObjectId
+from datetime import datetime
 
 pytestmark = pytest.mark.asyncio
 
-def test_root(client: TestClient):
-    """Test root endpoint using sync client"""
-    response = client.get("/")
+async def test_root(async_client: AsyncClient):
+    """Test root endpoint using async client"""
+    response = await async_client.get("/")
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "ok"
@@ -41,23 +41,28 @@ async def test_search_studies(async_client: AsyncClient):
         {
             "title": "AI Study",
             "text": "This study focuses on artificial intelligence.",
+            "authors": ["Researcher One"],
+            "publication_date": datetime.utcnow().isoformat(),
+            "journal": "AI Journal",
             "topic": "AI",
             "discipline": "Computer Science"
         },
         {
             "title": "Biology Study",
             "text": "This study examines cell biology.",
+            "authors": ["Researcher Two"],
+            "publication_date": datetime.utcnow().isoformat(),
+            "journal": "Cell Journal",
             "topic": "Biology",
             "discipline": "Life Sciences"
         }
     ]
     
-    # Create test studies
-    created_studies = []
-    for data in study_data:
-        response = await async_client.post("/studies/", json=data)
-        assert response.status_code == 200, f"Failed to create study: {response.text}"
-        created_studies.append(response.json()["details"]["id"])
+    # Create test studies in one request and one insert_many
+    response = await async_client.post("/scientific-studies/bulk", json=study_data)
+    assert response.status_code == 200, f"Failed to create studies: {response.text}"
+    created_studies = response.json()["details"]["ids"]
+    assert len(created_studies) == len(study_data)
     
     # Test search
     search_query = {
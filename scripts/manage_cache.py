@@ -1,14 +1,38 @@
 # scripts/manage_cache.py
 
 import argparse
+import asyncio
 import json
 from datetime import timedelta
 from app.core.cache_manager import cache_manager
+from app.core.database import database, Collection
+from app.core.embedding_matrix import EmbeddingMatrix
+from app.core.ann_index import ANNIndex
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Collections that get a precomputed embedding matrix
+EMBEDDING_COLLECTIONS = [Collection.SCIENTIFIC_STUDIES, Collection.ARTICLES]
+
+async def rebuild_embedding_matrices() -> dict:
+    """Dump the embeddings of every searchable collection to disk."""
+    try:
+        await database.connect()
+        return {
+            collection.value: await EmbeddingMatrix(collection).rebuild()
+            for collection in EMBEDDING_COLLECTIONS
+        }
+    finally:
+        await database.disconnect()
+
+def clear_embedding_matrices() -> None:
+    """Remove precomputed embedding matrices and saved HNSW indexes."""
+    for collection in EMBEDDING_COLLECTIONS:
+        EmbeddingMatrix(collection).invalidate()
+        ANNIndex(collection).invalidate()
+
 def parse_age(age_str: str) -> timedelta:
     """Parse age string into timedelta.
     
@@ -55,13 +79,13 @@ def main():
     parser = argparse.ArgumentParser(description='Manage application cache')
     parser.add_argument(
         '--action',
-        choices=['stats', 'clear', 'cleanup'],
+        choices=['stats', 'clear', 'cleanup', 'rebuild'],
         default='stats',
         help='Action to perform'
     )
     parser.add_argument(
         '--cache-type',
-        choices=['model', 'main', 'all'],
+        choices=['model', 'main', 'embedding-matrix', 'all'],
         default='all',
         help='Type of cache to manage'
     )
@@ -87,6 +111,10 @@ def main():
             else:
                 display_cache_stats(stats)
         
+        elif args.action == 'clear' and args.cache_type == 'embedding-matrix':
+            clear_embedding_matrices()
+            print("Successfully cleared embedding-matrix cache")
+        
         elif args.action == 'clear':
             cache_type = None if args.cache_type == 'all' else args.cache_type
             success = cache_manager.clear_cache(cache_type)
@@ -106,6 +134,19 @@ def main():
                 print(f"Files removed: {cleanup_stats['removed']}")
                 print(f"Failed removals: {cleanup_stats['failed']}")
                 print(f"Space freed: {cache_manager.bytes_to_gb(cleanup_stats['size_freed']):.2f}GB")
+        
+        elif args.action == 'rebuild':
+            if args.cache_type != 'embedding-matrix':
+                print("Only the embedding-matrix cache can be rebuilt")
+                return 1
+            
+            rows = asyncio.run(rebuild_embedding_matrices())
+            if args.format == 'json':
+                print(json.dumps(rows, indent=2))
+            else:
+                print("\nEmbedding Matrix Rebuild:")
+                for collection, count in rows.items():
+                    print(f"{collection}: {count} rows")
     
     except Exception as e:
         logger.error(f"Error managing cache: {e}")
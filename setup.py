@@ -18,6 +18,7 @@ setup(
         "beautifulsoup4>=4.12.3",
         "aiohttp>=3.9.5",
         "python-multipart>=0.0.9",
+        "orjson>=3.9.10",
         # Add other dependencies from your requirements.txt
     ],
     python_requires=">=3.11",  # Specify minimum Python version